@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, undefer_group
 from typing import List, Optional
 from app.database import get_db
 from app.models.rounds import UnifiedEvent, EventType, EventStatus, EventMode
+from app.models.team_totals import refresh_team_totals
 from app.schemas.event import Event as EventSchema, EventCreate, EventUpdate, EventStats
 from app.auth import get_current_user
 
@@ -19,7 +20,7 @@ async def get_events(
 ):
     """Get all events with optional filtering"""
     # Get only main events (round_number = 0)
-    query = db.query(UnifiedEvent).filter(UnifiedEvent.round_number == 0)
+    query = db.query(UnifiedEvent).options(undefer_group("detail")).filter(UnifiedEvent.round_number == 0)
     
     # Filter by club if user is club representative, but allow access to main title events
     if current_user.role == "clubs":
@@ -42,7 +43,11 @@ async def get_events(
     result = []
     for event in main_events:
         # Get all rounds for this event
-        rounds = db.query(UnifiedEvent).filter(
+        rounds = db.query(UnifiedEvent).options(
+            undefer_group("detail"),
+            selectinload(UnifiedEvent.criteria_items),
+            selectinload(UnifiedEvent.shortlisted_team_items)
+        ).filter(
             UnifiedEvent.event_id == event.event_id,
             UnifiedEvent.round_number > 0
         ).order_by(UnifiedEvent.round_number).all()
@@ -125,7 +130,7 @@ async def get_event_stats(db: Session = Depends(get_db)):
 @router.get("/{event_id}", response_model=EventSchema)
 async def get_event(event_id: str, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
     """Get a specific event by event_id"""
-    event = db.query(UnifiedEvent).filter(
+    event = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
         UnifiedEvent.event_id == event_id, 
         UnifiedEvent.round_number == 0
     ).first()
@@ -152,7 +157,7 @@ async def get_event_rounds(event_id: str, db: Session = Depends(get_db), current
     if current_user.role == "clubs" and event.club != current_user.club and event.type != EventType.TITLE:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    rounds = db.query(UnifiedEvent).filter(
+    rounds = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
         UnifiedEvent.event_id == event_id,
         UnifiedEvent.round_number > 0
     ).order_by(UnifiedEvent.round_number).all()
@@ -271,6 +276,8 @@ async def delete_event(event_id: str, db: Session = Depends(get_db), current_use
     
     # Delete all rounds for this event first
     db.query(UnifiedEvent).filter(UnifiedEvent.event_id == event_id).delete()
+    # Bulk delete skips the ORM hooks, so drop these rounds from the team totals here
+    refresh_team_totals(db.connection())
     db.commit()
     
     return {"message": "Event deleted successfully"}
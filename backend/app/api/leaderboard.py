@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from typing import List, Dict, Any, Optional
@@ -13,8 +15,9 @@ from app.auth import get_current_user, require_pda_role
 from app.services.gmail_service import gmail_service
 from app.services.gmail_service_mock import mock_gmail_service
 from app.services.pdf_service import PDFService
-import csv
-import io
+from app.services.export_service import csv_chunks
+from collections import defaultdict
+from operator import itemgetter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -48,32 +51,38 @@ async def get_evaluated_rounds(db: Session = Depends(get_db)):
     
     rounds_with_weights = []
     
+    # Get all weights in one query (plain tuples)
+    all_round_ids = [round_data.id for round_data in all_rounds]
+    weights = dict(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
+        RoundWeight.round_id.in_(all_round_ids)
+    )) if all_round_ids else {}
+    missing_weights = False
+    
     for round_data in all_rounds:
         # Get weight for this round, create default if not exists
-        weight = db.query(RoundWeight).filter(
-            RoundWeight.round_id == round_data.id
-        ).first()
-        
-        if not weight:
+        if round_data.id not in weights:
             # Create default weight of 100%
-            weight = RoundWeight(
+            db.add(RoundWeight(
                 round_id=round_data.id,
                 weight_percentage=100.0
-            )
-            db.add(weight)
-            db.commit()
-            db.refresh(weight)
+            ))
+            weights[round_data.id] = 100.0
+            missing_weights = True
         
         rounds_with_weights.append({
             "round_id": round_data.id,
             "round_number": round_data.round_number,
             "round_name": round_data.name,
             "event_id": round_data.event_id,
-            "weight_percentage": weight.weight_percentage,
+            "weight_percentage": weights[round_data.id],
             "is_frozen": round_data.is_frozen,
             "is_evaluated": round_data.is_evaluated
         })
     
+    # Commit all new default weights at once
+    if missing_weights:
+        db.commit()
+    
     return {"evaluated_rounds": rounds_with_weights}
 
 @router.get("/")
@@ -99,9 +108,6 @@ async def get_leaderboard(db: Session = Depends(get_db)):
     if not all_rounds:
         return {"teams": [], "message": "No evaluated or frozen rounds found"}
     
-    # Get all teams (including eliminated and completed)
-    all_teams = db.query(Team).all()
-    
     leaderboard = []
     
     # Create a set of all round IDs for faster lookup
@@ -110,12 +116,10 @@ async def get_leaderboard(db: Session = Depends(get_db)):
     # Pre-fetch all weights to avoid repeated queries
     weights_cache = {}
     if all_round_ids:
-        existing_weights = db.query(RoundWeight).filter(
+        # Plain (round_id, weight_percentage) tuples - no ORM objects needed for a lookup dict
+        weights_cache.update(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
             RoundWeight.round_id.in_(all_round_ids)
-        ).all()
-        
-        for weight in existing_weights:
-            weights_cache[weight.round_id] = weight.weight_percentage
+        ))
         
         # Create missing weights in batch
         missing_round_ids = all_round_ids - set(weights_cache.keys())
@@ -131,32 +135,19 @@ async def get_leaderboard(db: Session = Depends(get_db)):
         if missing_round_ids:
             db.commit()
     
+    # Get all teams (including eliminated and completed), after any weight commit so they aren't expired
+    all_teams = db.query(Team).all()
+    
+    # Total weight and rounds completed are the same for every team
+    total_weight = sum(weights_cache.get(round_id, 100.0) / 100.0 for round_id in all_round_ids)
+    rounds_completed = len(all_round_ids)
+    
+    current_round_updates = []
+    
     for team in all_teams:
-        # Get scores for this team from all relevant rounds
-        team_scores = db.query(TeamScore).filter(
-            TeamScore.team_id == team.team_id,
-            TeamScore.round_id.in_(all_round_ids)
-        ).all()
-        
-        # Create a dictionary of scores for easier lookup
-        team_scores_dict = {score.round_id: score.score for score in team_scores}
-        
-        # Calculate weighted score (sum of weighted scores) and weighted average
-        total_weighted_score = 0.0
-        total_weight = 0.0
-        rounds_completed = 0
-        
-        for round_id in all_round_ids:
-            # Use cached weight
-            weight_percentage = weights_cache.get(round_id, 100.0)
-            
-            # Get score for this round (0 if not found)
-            round_score = team_scores_dict.get(round_id, 0.0)
-            
-            weight_value = weight_percentage / 100.0  # Convert to decimal
-            total_weighted_score += round_score * weight_value
-            total_weight += weight_value
-            rounds_completed += 1
+        # Weighted score (sum of weighted scores) is kept up to date on the team row
+        total_weighted_score = team.current_total_score or 0.0
+        current_round = team.current_round
         
         if total_weight > 0:
             # Calculate weighted average for reference
@@ -165,9 +156,10 @@ async def get_leaderboard(db: Session = Depends(get_db)):
             # Update current_round for active teams: current_round = rounds_completed + 1
             if team.status == TeamStatus.ACTIVE:
                 new_current_round = rounds_completed + 1
-                if team.current_round != new_current_round:
-                    team.current_round = new_current_round
-                    # We'll commit this change at the end
+                if current_round != new_current_round:
+                    # Written in one batch at the end
+                    current_round_updates.append({"id": team.id, "current_round": new_current_round})
+                    current_round = new_current_round
             
             # Use weighted score (sum) as the primary metric
             final_score = total_weighted_score
@@ -179,31 +171,24 @@ async def get_leaderboard(db: Session = Depends(get_db)):
                 "final_score": round(final_score, 2),
                 "weighted_average": round(weighted_average, 2),
                 "rounds_completed": rounds_completed,
-                "current_round": team.current_round,
+                "current_round": current_round,
                 "status": team.status
             })
     
-    # Add normalized score for reference (optional)
-    if leaderboard:
-        # Find the maximum final score (weighted score)
-        max_score = max(team["final_score"] for team in leaderboard)
-        
-        # Add normalized score for reference
-        for team in leaderboard:
-            if max_score > 0:
-                normalized_score = (team["final_score"] / max_score) * 100
-                team["normalized_score"] = round(normalized_score, 2)
-            else:
-                team["normalized_score"] = 0.0
-    
-    # Sort by final score (descending)
-    leaderboard.sort(key=lambda x: x["final_score"], reverse=True)
+    # Sort by final score (weighted score) descending
+    leaderboard.sort(key=itemgetter("final_score"), reverse=True)
     
-    # Add rank
-    for i, team in enumerate(leaderboard):
-        team["rank"] = i + 1
+    # Add normalized score (for reference) and rank in one pass; after sorting
+    # the maximum final score is the first entry's
+    max_score = leaderboard[0]["final_score"] if leaderboard else 0
+    scale = 100 / max_score if max_score > 0 else 0.0
+    for i, team in enumerate(leaderboard, 1):
+        team["normalized_score"] = round(team["final_score"] * scale, 2)
+        team["rank"] = i
     
-    # Commit any current_round updates
+    # Commit any current_round updates in one batched UPDATE
+    if current_round_updates:
+        db.bulk_update_mappings(Team, current_round_updates)
     db.commit()
     
     return {"teams": leaderboard}
@@ -241,17 +226,8 @@ async def update_round_weight(
     
     return round_weight
 
-@router.get("/export")
-async def export_leaderboard(db: Session = Depends(get_db)):
-    """Export leaderboard data as CSV with roundwise scores"""
-    
-    # Get leaderboard data
-    leaderboard_data = await get_leaderboard(db)
-    teams = leaderboard_data.get("teams", [])
-    
-    if not teams:
-        raise HTTPException(status_code=404, detail="No leaderboard data found to export")
-    
+def _leaderboard_csv_rows(db: Session, teams: List[Dict[str, Any]]):
+    """Header and row generator for the leaderboard CSV with roundwise scores"""
     # Get all evaluated and frozen rounds for column headers
     evaluated_rounds = db.query(UnifiedEvent).filter(
         UnifiedEvent.is_evaluated == True,
@@ -266,10 +242,7 @@ async def export_leaderboard(db: Session = Depends(get_db)):
     
     all_rounds = evaluated_rounds + frozen_rounds
     all_rounds.sort(key=lambda x: x.round_number)
-    
-    # Create CSV content
-    output = io.StringIO()
-    writer = csv.writer(output)
+    round_ids = [round_data.id for round_data in all_rounds]
     
     # Create header with round columns
     header = [
@@ -281,44 +254,46 @@ async def export_leaderboard(db: Session = Depends(get_db)):
     for round_data in all_rounds:
         header.append(f"Round {round_data.round_number} Score")
     
-    writer.writerow(header)
-    
-    # Get team scores for all teams
-    team_scores_dict = {}
-    for team in teams:
-        team_scores = db.query(TeamScore).filter(
-            TeamScore.team_id == team["team_id"]
-        ).all()
-        team_scores_dict[team["team_id"]] = {score.round_id: score.score for score in team_scores}
-    
-    # Write data
-    for team in teams:
-        row = [
-            team["rank"],
-            team["team_id"],
-            team["team_name"],
-            team["leader_name"],
-            team["final_score"],
-            team["normalized_score"],  # This is the percentile
-            team["rounds_completed"],
-            team["status"]
-        ]
-        
-        # Add round scores
-        team_scores = team_scores_dict.get(team["team_id"], {})
-        for round_data in all_rounds:
-            score = team_scores.get(round_data.id, 0.0)
-            row.append(round(score, 2))
-        
-        writer.writerow(row)
+    # Get team scores for all teams in one query
+    team_scores_dict = defaultdict(dict)
+    for team_id, round_id, score in db.query(TeamScore.team_id, TeamScore.round_id, TeamScore.score).filter(
+        TeamScore.round_id.in_(round_ids)
+    ):
+        team_scores_dict[team_id][round_id] = score
     
-    # Get CSV content
-    csv_content = output.getvalue()
-    output.close()
+    def rows():
+        for team in teams:
+            # Add round scores
+            team_scores = team_scores_dict.get(team["team_id"], {})
+            yield [
+                team["rank"],
+                team["team_id"],
+                team["team_name"],
+                team["leader_name"],
+                team["final_score"],
+                team["normalized_score"],  # This is the percentile
+                team["rounds_completed"],
+                team["status"]
+            ] + [round(team_scores.get(round_id, 0.0), 2) for round_id in round_ids]
     
-    # Return CSV file
-    return Response(
-        content=csv_content,
+    return header, rows()
+
+@router.get("/export")
+async def export_leaderboard(db: Session = Depends(get_db)):
+    """Export leaderboard data as CSV with roundwise scores"""
+    
+    # Get leaderboard data
+    leaderboard_data = await get_leaderboard(db)
+    teams = leaderboard_data.get("teams", [])
+    
+    if not teams:
+        raise HTTPException(status_code=404, detail="No leaderboard data found to export")
+    
+    header, rows = _leaderboard_csv_rows(db, teams)
+    
+    # Stream the CSV file
+    return StreamingResponse(
+        csv_chunks(header, rows),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=leaderboard.csv"}
     )
@@ -368,12 +343,10 @@ async def shortlist_teams_by_overall_score(
     all_round_ids = {round_obj.id for round_obj in all_rounds}
     
     if all_round_ids:
-        existing_weights = db.query(RoundWeight).filter(
+        # Plain (round_id, weight_percentage) tuples - no ORM objects needed for a lookup dict
+        weights_cache.update(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
             RoundWeight.round_id.in_(all_round_ids)
-        ).all()
-        
-        for weight in existing_weights:
-            weights_cache[weight.round_id] = weight.weight_percentage
+        ))
         
         # Create missing weights in batch
         missing_round_ids = all_round_ids - set(weights_cache.keys())
@@ -391,15 +364,17 @@ async def shortlist_teams_by_overall_score(
     
     # Calculate overall scores for all teams using cached weights
     all_teams_with_scores = []
+    
+    # Get scores for all teams from all relevant rounds in one query
+    scores_by_team = defaultdict(dict)
+    for team_id, round_id, score in db.query(TeamScore.team_id, TeamScore.round_id, TeamScore.score).filter(
+        TeamScore.round_id.in_(all_round_ids)
+    ):
+        scores_by_team[team_id][round_id] = score
+    
     for team in all_active_teams:
-        # Get scores for this team from all relevant rounds
-        team_scores = db.query(TeamScore).filter(
-            TeamScore.team_id == team.team_id,
-            TeamScore.round_id.in_(all_round_ids)
-        ).all()
-        
         # Create a dictionary of scores for easier lookup
-        team_scores_dict = {score.round_id: score.score for score in team_scores}  # Use normalized scores for shortlisting
+        team_scores_dict = scores_by_team[team.team_id]  # Use normalized scores for shortlisting
         
         # Calculate weighted average (including 0 scores for missing rounds)
         total_weighted_score = 0.0
@@ -423,6 +398,7 @@ async def shortlist_teams_by_overall_score(
             weighted_average = total_weighted_score / total_weight
             
             all_teams_with_scores.append({
+                'id': team.id,
                 'team_id': team.team_id,
                 'team_name': team.team_name,
                 'overall_score': weighted_average,  # Use weighted average for shortlisting
@@ -457,17 +433,22 @@ async def shortlist_teams_by_overall_score(
             else:
                 eliminated_teams.append(team_data)
     
-    # Update team statuses
-    for team_data in shortlisted_teams:
-        team = db.query(Team).filter(Team.team_id == team_data['team_id']).first()
-        if team:
-            team.status = TeamStatus.ACTIVE  # Keep as active (shortlisted)
-            team.current_round = team_data['rounds_completed'] + 1  # Set current round to rounds_completed + 1
-    
-    for team_data in eliminated_teams:
-        team = db.query(Team).filter(Team.team_id == team_data['team_id']).first()
-        if team:
-            team.status = TeamStatus.ELIMINATED  # Mark as eliminated
+    # Update team statuses in batched UPDATEs
+    if shortlisted_teams:
+        db.bulk_update_mappings(Team, [
+            {
+                "id": team_data['id'],
+                "status": TeamStatus.ACTIVE,  # Keep as active (shortlisted)
+                "current_round": team_data['rounds_completed'] + 1  # Set current round to rounds_completed + 1
+            }
+            for team_data in shortlisted_teams
+        ])
+    
+    if eliminated_teams:
+        db.bulk_update_mappings(Team, [
+            {"id": team_data['id'], "status": TeamStatus.ELIMINATED}  # Mark as eliminated
+            for team_data in eliminated_teams
+        ])
     
     # Set is_evaluated = 1 for ALL frozen rounds
     frozen_rounds_updated = 0
@@ -489,9 +470,10 @@ async def shortlist_teams_by_overall_score(
 @router.get("/gmail-status")
 async def get_gmail_status():
     """Check Gmail service status (for debugging)"""
+    authenticated = await run_in_threadpool(gmail_service.is_authenticated)
     return {
-        "authenticated": gmail_service.is_authenticated(),
-        "error": gmail_service.get_auth_error() if not gmail_service.is_authenticated() else None
+        "authenticated": authenticated,
+        "error": gmail_service.get_auth_error() if not authenticated else None
     }
 
 @router.post("/test-email")
@@ -500,7 +482,7 @@ async def test_email_sending(
     current_user = Depends(require_pda_role())
 ):
     """Test email sending (for debugging)"""
-    if not gmail_service.is_authenticated():
+    if not await run_in_threadpool(gmail_service.is_authenticated):
         error_msg = gmail_service.get_auth_error()
         raise HTTPException(
             status_code=503, 
@@ -536,9 +518,10 @@ async def export_leaderboard_via_email(
     """Export leaderboard data as CSV and send via email (PDA only)"""
     
     # Use mock service for testing if Gmail is not authenticated
-    email_service = gmail_service if gmail_service.is_authenticated() else mock_gmail_service
+    gmail_ready = await run_in_threadpool(gmail_service.is_authenticated)
+    email_service = gmail_service if gmail_ready else mock_gmail_service
     
-    if not gmail_service.is_authenticated():
+    if not gmail_ready:
         print("Using mock Gmail service for testing")
     
     try:
@@ -549,70 +532,9 @@ async def export_leaderboard_via_email(
         if not teams:
             raise HTTPException(status_code=400, detail="No leaderboard data found to export")
         
-        # Get all evaluated and frozen rounds for column headers
-        evaluated_rounds = db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_evaluated == True,
-            UnifiedEvent.round_number > 0
-        ).all()
-        
-        frozen_rounds = db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_frozen == True,
-            UnifiedEvent.is_evaluated == False,
-            UnifiedEvent.round_number > 0
-        ).all()
-        
-        all_rounds = evaluated_rounds + frozen_rounds
-        all_rounds.sort(key=lambda x: x.round_number)
-        
-        # Create CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Create header with round columns
-        header = [
-            "Rank", "Team ID", "Team Name", "Leader Name", 
-            "Final Score", "Percentile", "Rounds Completed", "Status"
-        ]
-        
-        # Add round columns
-        for round_data in all_rounds:
-            header.append(f"Round {round_data.round_number} Score")
-        
-        writer.writerow(header)
-        
-        # Get team scores for all teams
-        team_scores_dict = {}
-        for team in teams:
-            team_scores = db.query(TeamScore).filter(
-                TeamScore.team_id == team["team_id"]
-            ).all()
-            team_scores_dict[team["team_id"]] = {score.round_id: score.score for score in team_scores}
-        
-        # Write data
-        for team in teams:
-            row = [
-                team["rank"],
-                team["team_id"],
-                team["team_name"],
-                team["leader_name"],
-                team["final_score"],
-                team["normalized_score"],  # This is the percentile
-                team["rounds_completed"],
-                team["status"]
-            ]
-            
-            # Add round scores
-            team_scores = team_scores_dict.get(team["team_id"], {})
-            for round_data in all_rounds:
-                score = team_scores.get(round_data.id, 0.0)
-                row.append(round(score, 2))
-            
-            writer.writerow(row)
-        
-        # Get CSV content as bytes
-        csv_content = output.getvalue()
-        output.close()
-        csv_bytes = csv_content.encode('utf-8')
+        # Build CSV content as bytes
+        header, rows = _leaderboard_csv_rows(db, teams)
+        csv_bytes = "".join(csv_chunks(header, rows)).encode('utf-8')
         
         # Send email with CSV attachment
         try:
@@ -679,7 +601,7 @@ async def export_leaderboard_pdf(
         
         # Filter only ACTIVE teams for official and shortlisted PDFs
         if format_type in ["official", "shortlisted"]:
-            teams = [team for team in teams if team.get("status") == "ACTIVE"]
+            teams = [team for team in teams if team.get("status") == TeamStatus.ACTIVE]
         
         # Remove emojis from team names
         import re
@@ -711,21 +633,21 @@ async def export_leaderboard_pdf(
         
         # Generate PDF based on format type
         if format_type == "official":
-            pdf_bytes = pdf_service.generate_official_leaderboard_pdf(
+            pdf_bytes = await pdf_service.generate_official_leaderboard_pdf(
                 teams=teams,
                 event_name="CRESTORA'25",
                 round_number=round_number
             )
             filename = f"Crestora_Round{round_number}_results.pdf"
         elif format_type == "shortlisted":
-            pdf_bytes = pdf_service.generate_shortlisted_leaderboard_pdf(
+            pdf_bytes = await pdf_service.generate_shortlisted_leaderboard_pdf(
                 teams=teams,
                 event_name="CRESTORA'25",
                 round_number=round_number
             )
             filename = f"Crestora_Round{round_number}_shortlisted.pdf"
         else:
-            pdf_bytes = pdf_service.generate_detailed_leaderboard_pdf(
+            pdf_bytes = await pdf_service.generate_detailed_leaderboard_pdf(
                 teams=teams,
                 event_name="CRESTORA'25",
                 include_scores=True
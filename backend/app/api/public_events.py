@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, undefer_group
 from typing import List, Optional
 from app.database import get_db
 from app.models.rounds import UnifiedEvent, EventType, EventStatus, EventMode
@@ -21,7 +21,11 @@ async def get_public_rounds(
     """
     try:
         # Get all rounds (round_number > 0) directly
-        rounds = db.query(UnifiedEvent).filter(
+        rounds = db.query(UnifiedEvent).options(
+            undefer_group("detail"),
+            selectinload(UnifiedEvent.criteria_items),
+            selectinload(UnifiedEvent.shortlisted_team_items)
+        ).filter(
             UnifiedEvent.round_number > 0
         ).order_by(UnifiedEvent.event_id, UnifiedEvent.round_number).offset(skip).limit(limit).all()
         
@@ -76,7 +80,7 @@ async def get_public_rolling_events(
     """
     try:
         # Get rolling events (type = rolling, round_number = 0)
-        rolling_events = db.query(UnifiedEvent).filter(
+        rolling_events = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
             UnifiedEvent.type == EventType.ROLLING,
             UnifiedEvent.round_number == 0
         ).offset(skip).limit(limit).all()
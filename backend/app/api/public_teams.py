@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload
 from typing import List, Optional
+from collections import defaultdict
+from operator import itemgetter
 from app.database import get_db
 from app.models.team import Team, TeamMember, TeamStatus
 from app.models.team_score import TeamScore
@@ -44,6 +46,12 @@ def calculate_overall_score(team_id: str, db: Session, weights_cache: dict = Non
     # Create a dictionary of scores for easier lookup
     team_scores_dict = {score.round_id: score.score for score in team_scores}
     
+    # Without a caller-supplied cache, load every weight in one query instead of one per round
+    if weights_cache is None:
+        weights_cache = dict(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
+            RoundWeight.round_id.in_(round_ids)
+        ))
+    
     # Calculate weighted average (including 0 scores for missing rounds)
     total_weighted_score = 0.0
     total_weight = 0.0
@@ -109,8 +117,8 @@ async def get_public_teams(
     """
     print("DEBUG: get_public_teams function called")
     
-    # First get teams
-    query = db.query(Team)
+    # First get teams (members are loaded in one extra query for the whole page)
+    query = db.query(Team).options(selectinload(Team.members), raiseload("*"))
     if status:
         query = query.filter(Team.status == status)
     
@@ -137,12 +145,10 @@ async def get_public_teams(
     
     # Pre-fetch all existing weights
     if all_round_ids:
-        existing_weights = db.query(RoundWeight).filter(
+        # Plain (round_id, weight_percentage) tuples - no ORM objects needed for a lookup dict
+        weights_cache.update(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
             RoundWeight.round_id.in_(all_round_ids)
-        ).all()
-        
-        for weight in existing_weights:
-            weights_cache[weight.round_id] = weight.weight_percentage
+        ))
         
         # Create missing weights in batch
         missing_round_ids = all_round_ids - set(weights_cache.keys())
@@ -158,11 +164,10 @@ async def get_public_teams(
         if missing_round_ids:
             db.commit()
     
-    # Then get members for each team separately and create proper response
+    # Then build the response from the eagerly loaded members
     result = []
     for team in teams:
-        # Get members for this team
-        members = db.query(TeamMember).filter(TeamMember.team_id == team.team_id).all()
+        members = team.members
         
         # Calculate overall score using cached weights
         overall_score = calculate_overall_score(team.team_id, db, weights_cache)
@@ -256,12 +261,11 @@ async def get_public_team(team_id: str, db: Session = Depends(get_db)):
     Returns:
     - Complete team information including members and overall score
     """
-    team = db.query(Team).filter(Team.team_id == team_id).first()
+    team = db.query(Team).options(selectinload(Team.members), raiseload("*")).filter(Team.team_id == team_id).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    # Get members for this team
-    members = db.query(TeamMember).filter(TeamMember.team_id == team.team_id).all()
+    members = team.members
     
     # Calculate overall score
     overall_score = calculate_overall_score(team.team_id, db)
@@ -406,19 +410,20 @@ async def get_public_leaderboard(
     # Pre-fetch all weights to avoid repeated queries
     weights_cache = {}
     if all_round_ids:
-        weights = db.query(RoundWeight).filter(RoundWeight.round_id.in_(all_round_ids)).all()
-        for weight in weights:
-            weights_cache[weight.round_id] = weight.weight_percentage
+        weights_cache.update(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
+            RoundWeight.round_id.in_(all_round_ids)
+        ))
+    
+    # Get all team scores across all rounds in one query
+    scores_by_team = defaultdict(dict)
+    for team_id, round_id, score in db.query(TeamScore.team_id, TeamScore.round_id, TeamScore.score).filter(
+        TeamScore.round_id.in_(all_round_ids)
+    ):
+        scores_by_team[team_id][round_id] = score
     
     for team in all_teams:
-        # Get all team scores for this team across all rounds
-        team_scores = db.query(TeamScore).filter(
-            TeamScore.team_id == team.team_id,
-            TeamScore.round_id.in_(all_round_ids)
-        ).all()
-        
         # Create a dictionary for faster lookup
-        team_scores_dict = {score.round_id: score.score for score in team_scores}
+        team_scores_dict = scores_by_team[team.team_id]
         
         # Calculate weighted score (sum of weighted scores) and weighted average
         total_weighted_score = 0.0
@@ -455,27 +460,18 @@ async def get_public_leaderboard(
                 "status": team.status
             })
     
-    # Add normalized score for reference (optional)
-    if leaderboard:
-        # Find the maximum final score (weighted score)
-        max_score = max(team["final_score"] for team in leaderboard)
-        
-        # Add normalized score for reference
-        for team in leaderboard:
-            if max_score > 0:
-                normalized_score = (team["final_score"] / max_score) * 100
-                team["normalized_score"] = round(normalized_score, 2)
-                team["percentile"] = round(normalized_score, 1)  # Keep for compatibility
-            else:
-                team["normalized_score"] = 0.0
-                team["percentile"] = 0.0
-    
     # Sort by final score (weighted score) descending
-    leaderboard.sort(key=lambda x: x["final_score"], reverse=True)
-    
-    # Add rank
-    for i, team in enumerate(leaderboard):
-        team["rank"] = i + 1
+    leaderboard.sort(key=itemgetter("final_score"), reverse=True)
+    
+    # Add normalized score (for reference) and rank in one pass; after sorting
+    # the maximum final score is the first entry's
+    max_score = leaderboard[0]["final_score"] if leaderboard else 0
+    scale = 100 / max_score if max_score > 0 else 0.0
+    for i, team in enumerate(leaderboard, 1):
+        normalized_score = team["final_score"] * scale
+        team["normalized_score"] = round(normalized_score, 2)
+        team["percentile"] = round(normalized_score, 1)  # Keep for compatibility
+        team["rank"] = i
     
     return {
         "leaderboard": leaderboard[:limit],
@@ -44,13 +44,21 @@ async def get_rolling_results(
     
     results = query.offset(skip).limit(limit).all()
     
-    # Enrich with event information
+    # Enrich with event information (one query for all main events of this page)
+    event_ids = {result.event_id for result in results}
+    events = {
+        event_id: (name, start_date)
+        for event_id, name, start_date in db.query(
+            UnifiedEvent.event_id, UnifiedEvent.name, UnifiedEvent.start_date
+        ).filter(
+            UnifiedEvent.event_id.in_(event_ids),
+            UnifiedEvent.round_number == 0
+        )
+    } if event_ids else {}
+    
     enriched_results = []
     for result in results:
-        event = db.query(UnifiedEvent).filter(
-            UnifiedEvent.event_id == result.event_id,
-            UnifiedEvent.round_number == 0
-        ).first()
+        event_name, event_start_date = events.get(result.event_id, (None, None))
         
         result_dict = {
             "id": result.id,
@@ -74,8 +82,8 @@ async def get_rolling_results(
             "is_evaluated": result.is_evaluated,
             "created_at": result.created_at,
             "updated_at": result.updated_at,
-            "event_name": event.name if event else None,
-            "event_date": event.start_date.isoformat() if event and event.start_date else None
+            "event_name": event_name,
+            "event_date": event_start_date.isoformat() if event_start_date else None
         }
         enriched_results.append(result_dict)
     
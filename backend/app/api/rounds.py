@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, selectinload, undefer_group
 from sqlalchemy import text
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, EmailStr
 from app.database import get_db
+from app.queries import round_by_number
 from app.models.rounds import UnifiedEvent, EventType, EventStatus, EventMode
 from app.schemas.unified_event import (
     UnifiedEventInDB, UnifiedEventCreate, UnifiedEventUpdate, 
-    EventWithRounds, EventStats, RoundReorderRequest
+    EventWithRounds, EventStats, RoundReorderRequest, RoundInDB
 )
 from app.schemas.team_score import TeamScoreInDB, TeamScoreUpdate, TeamEvaluationRequest
 from app.services.round_service import RoundService
 from app.services.export_service import ExportService
+from app.services.export_jobs import export_job_service
 from app.services.gmail_service import gmail_service
 from app.services.gmail_service_mock import mock_gmail_service
 from app.auth import get_current_user, require_pda_role, require_club_or_pda
@@ -36,7 +40,7 @@ async def create_round(
     round_service = RoundService(db)
     return round_service.create_round(round_data.dict(), current_user.role)
 
-@router.put("/rounds/{round_id}/criteria")
+@router.put("/rounds/{round_id}/criteria", response_model=UnifiedEventInDB)
 async def update_round_criteria(
     round_id: int,
     criteria: List[Dict[str, Any]],
@@ -164,24 +168,21 @@ async def export_round_data_via_email(
     round_service.validate_round_access(round_id, current_user.role, current_user.club)
     
     # Use mock service for testing if Gmail is not authenticated
-    email_service = gmail_service if gmail_service.is_authenticated() else mock_gmail_service
+    gmail_ready = await run_in_threadpool(gmail_service.is_authenticated)
+    email_service = gmail_service if gmail_ready else mock_gmail_service
     
-    if not gmail_service.is_authenticated():
+    if not gmail_ready:
         print("Using mock Gmail service for testing")
     
     try:
         # Get round information for email context
-        round_data = db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
+        round_data = db.get(UnifiedEvent, round_id)  # already loaded by validate_round_access
         if not round_data:
             raise HTTPException(status_code=404, detail="Round not found")
         
         # Export the data using the existing export service
         export_service = ExportService(db)
-        csv_response = export_service.export_round_data(round_id)
-        
-        # Get CSV content as bytes
-        csv_content = csv_response.body.decode('utf-8')
-        csv_bytes = csv_content.encode('utf-8')
+        csv_bytes = export_service.export_round_data_csv(round_id)
         
         # Send email with CSV attachment
         try:
@@ -250,6 +251,60 @@ async def export_round_data_via_email(
             detail=f"Failed to export and send round data: {str(e)}"
         )
 
+@router.post("/rounds/{round_id}/export-jobs", status_code=202)
+async def start_round_export_job(
+    round_id: int,
+    background_tasks: BackgroundTasks,
+    sort_by: str = "team_name",
+    db: Session = Depends(get_db),
+    current_user = Depends(require_club_or_pda())
+):
+    """Start a round export in the background; poll /exports/{job_id} for the download URL"""
+    if sort_by not in ["team_name", "score"]:
+        sort_by = "team_name"
+    
+    round_service = RoundService(db)
+    round_service.validate_round_access(round_id, current_user.role, current_user.club)
+    
+    job = export_job_service.create_round_export_job(round_id, sort_by, current_user.username)
+    background_tasks.add_task(export_job_service.run_round_export, job["job_id"])
+    return {"job_id": job["job_id"], "status": job["status"]}
+
+def _get_export_job(job_id: str, current_user) -> dict:
+    job = export_job_service.get_job(job_id)
+    if not job or (current_user.role != "admin" and job["requested_by"] != current_user.username):
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+@router.get("/exports/{job_id}")
+async def get_export_job(
+    job_id: str,
+    current_user = Depends(require_club_or_pda())
+):
+    """Export job status: 202 while running, 200 with download_url once finished"""
+    job = _get_export_job(job_id, current_user)
+    content = {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "round_id": job["round_id"],
+        "download_url": export_job_service.get_download_url(job) if job["status"] == "completed" else None,
+        "error": job["error"]
+    }
+    if job["status"] in ("pending", "running"):
+        return JSONResponse(status_code=202, content=content)
+    return content
+
+@router.get("/exports/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    current_user = Depends(require_club_or_pda())
+):
+    """Download a finished export that was stored on local disk"""
+    job = _get_export_job(job_id, current_user)
+    if job["status"] != "completed" or not job["file_path"]:
+        raise HTTPException(status_code=404, detail="Export file not available")
+    return FileResponse(job["file_path"], media_type="text/csv", filename=job["file_name"])
+
 @router.post("/rounds/{round_id}/toggle-elimination")
 async def toggle_elimination_setting(
     round_id: int,
@@ -271,7 +326,7 @@ async def get_events(
 ):
     """Get all events with their rounds"""
     # Get main events (round_number = 0)
-    query = db.query(UnifiedEvent).filter(UnifiedEvent.round_number == 0)
+    query = db.query(UnifiedEvent).options(undefer_group("detail")).filter(UnifiedEvent.round_number == 0)
     
     if event_type:
         query = query.filter(UnifiedEvent.type == event_type)
@@ -285,14 +340,17 @@ async def get_events(
     result = []
     for event in main_events:
         # Get all rounds for this event
-        rounds = db.query(UnifiedEvent).filter(
+        rounds = db.query(UnifiedEvent).options(
+            undefer_group("detail"),
+            selectinload(UnifiedEvent.criteria_items),
+            selectinload(UnifiedEvent.shortlisted_team_items)
+        ).filter(
             UnifiedEvent.event_id == event.event_id,
             UnifiedEvent.round_number > 0
         ).order_by(UnifiedEvent.round_number).all()
         
-        # Convert rounds to RoundInDB format using Pydantic model
-        from app.schemas.unified_event import RoundInDB
-        rounds_data = [RoundInDB.model_validate(round_data).model_dump(exclude_none=False) for round_data in rounds]
+        # Convert rounds to RoundInDB format (validated once by the response model)
+        rounds_data = [{field: getattr(round_obj, field) for field in RoundInDB.model_fields} for round_obj in rounds]
         
         # Build event with rounds
         event_data = {
@@ -372,7 +430,7 @@ async def get_event_stats(db: Session = Depends(get_db)):
 async def get_event(event_id: str, db: Session = Depends(get_db)):
     """Get a specific event with all its rounds"""
     # Get main event
-    event = db.query(UnifiedEvent).filter(
+    event = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
         UnifiedEvent.event_id == event_id,
         UnifiedEvent.round_number == 0
     ).first()
@@ -381,7 +439,7 @@ async def get_event(event_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Event not found")
     
     # Get all rounds for this event
-    rounds = db.query(UnifiedEvent).filter(
+    rounds = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
         UnifiedEvent.event_id == event_id,
         UnifiedEvent.round_number > 0
     ).order_by(UnifiedEvent.round_number).all()
@@ -504,10 +562,7 @@ async def update_event_or_round(
 ):
     """Update an event or round (PDA can update all, clubs can update their own)"""
     try:
-        event = db.query(UnifiedEvent).filter(
-            UnifiedEvent.event_id == event_id,
-            UnifiedEvent.round_number == round_number
-        ).first()
+        event = db.execute(round_by_number(event_id, round_number)).scalars().first()
         
         if not event:
             raise HTTPException(status_code=404, detail="Event or round not found")
@@ -572,10 +627,7 @@ async def delete_round(
 ):
     """Delete a specific round (PDA only)"""
     try:
-        round_data = db.query(UnifiedEvent).filter(
-            UnifiedEvent.event_id == event_id,
-            UnifiedEvent.round_number == round_number
-        ).first()
+        round_data = db.execute(round_by_number(event_id, round_number)).scalars().first()
         
         if not round_data:
             raise HTTPException(status_code=404, detail="Round not found")
@@ -591,6 +643,7 @@ async def delete_round(
         from app.models.team_score import TeamScore
         from app.models.round_weight import RoundWeight
         from app.models.evaluation import Evaluation
+        from app.models.team_totals import refresh_team_totals
         
         try:
             # Delete evaluations for this specific round
@@ -611,6 +664,9 @@ async def delete_round(
             ).delete()
             print(f"Deleted {round_weights_deleted} round weights for round {round_data.id}")
             
+            # Bulk deletes skip the ORM hooks, so recompute the team totals without this round's scores
+            refresh_team_totals(db.connection())
+            
             # Commit the related data deletions first
             db.commit()
             
@@ -678,7 +734,7 @@ async def get_round_details(
 ):
     """Get round details by ID (name, club, etc.) - PUBLIC ACCESS"""
     try:
-        round_data = db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
+        round_data = db.query(UnifiedEvent).options(undefer_group("detail")).filter(UnifiedEvent.id == round_id).first()
         
         if not round_data:
             raise HTTPException(status_code=404, detail="Round not found")
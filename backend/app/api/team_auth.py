@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload
 from app.database import get_db
 from app.models.team import Team, TeamMember, TeamStatus
 from app.schemas.team import TeamInDB as TeamSchema
@@ -26,7 +26,9 @@ async def team_login(
     This endpoint is public but validates credentials
     """
     # Find team by team_id
-    team = db.query(Team).filter(Team.team_id == login_data.team_id).first()
+    team = db.query(Team).options(selectinload(Team.members), raiseload("*")).filter(
+        Team.team_id == login_data.team_id
+    ).first()
     
     if not team:
         raise HTTPException(
@@ -48,8 +50,8 @@ async def team_login(
             detail="Invalid password"
         )
     
-    # Get team members
-    members = db.query(TeamMember).filter(TeamMember.team_id == team.team_id).all()
+    # Team members were loaded together with the team
+    members = team.members
     
     # Create team response (without password)
     team_data = {
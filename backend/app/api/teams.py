@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload, noload
 from typing import List, Optional
 from app.database import get_db
 from app.models.team import Team, TeamMember, TeamStatus
@@ -60,6 +60,12 @@ def calculate_overall_score(team_id: str, db: Session, weights_cache: dict = Non
     # Create a dictionary of scores for easier lookup
     team_scores_dict = {score.round_id: score.score for score in team_scores}
     
+    # Without a caller-supplied cache, load every weight in one query instead of one per round
+    if weights_cache is None:
+        weights_cache = dict(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
+            RoundWeight.round_id.in_(round_ids)
+        ))
+    
     # Calculate weighted average (including 0 scores for missing rounds)
     total_weighted_score = 0.0
     total_weight = 0.0
@@ -111,10 +117,9 @@ async def get_teams(
 ):
     """Get all teams with optional filtering"""
     print("DEBUG: get_teams function called")
-    from sqlalchemy.orm import joinedload
     
-    # First get teams
-    query = db.query(Team)
+    # First get teams (members are loaded in one extra query for the whole page)
+    query = db.query(Team).options(selectinload(Team.members), raiseload("*"))
     if status:
         query = query.filter(Team.status == status)
     
@@ -141,12 +146,10 @@ async def get_teams(
     
     # Pre-fetch all existing weights
     if all_round_ids:
-        existing_weights = db.query(RoundWeight).filter(
+        # Plain (round_id, weight_percentage) tuples - no ORM objects needed for a lookup dict
+        weights_cache.update(db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
             RoundWeight.round_id.in_(all_round_ids)
-        ).all()
-        
-        for weight in existing_weights:
-            weights_cache[weight.round_id] = weight.weight_percentage
+        ))
         
         # Create missing weights in batch
         missing_round_ids = all_round_ids - set(weights_cache.keys())
@@ -162,24 +165,10 @@ async def get_teams(
         if missing_round_ids:
             db.commit()
     
-    # Then get members for each team separately and create proper Pydantic models
+    # Then build the response from the eagerly loaded members
     result = []
     for team in teams:
-        # Get members for this team
-        members = db.query(TeamMember).filter(TeamMember.team_id == team.team_id).all()
-        
-        # Create TeamMemberInDB objects
-        member_objects = [
-            TeamMemberInDB(
-                id=member.id,
-                team_id=member.team_id,
-                member_name=member.member_name,
-                register_number=member.register_number,
-                member_position=member.member_position,
-                created_at=member.created_at
-            )
-            for member in members
-        ]
+        members = team.members
         
         # Calculate overall score using cached weights
         overall_score = calculate_overall_score(team.team_id, db, weights_cache)
@@ -249,16 +238,11 @@ async def export_teams(
     """Export teams data as CSV based on filter conditions"""
     try:
         # Build query based on filters
-        query = db.query(Team)
+        query = db.query(Team).options(selectinload(Team.members), raiseload("*"))
         
         # Apply status filter
-        if status and status != "all":
-            if status.upper() == "ACTIVE":
-                query = query.filter(Team.status == TeamStatus.ACTIVE)
-            elif status.upper() == "ELIMINATED":
-                query = query.filter(Team.status == TeamStatus.ELIMINATED)
-            elif status.upper() == "COMPLETED":
-                query = query.filter(Team.status == TeamStatus.COMPLETED)
+        if status and status != "all" and status.upper() in TeamStatus.__members__:
+            query = query.filter(Team.status == TeamStatus[status.upper()])
         
         # Apply search filter
         if search:
@@ -284,22 +268,18 @@ async def export_teams(
             "Status", "Members Count", "Created At", "Updated At"
         ])
         
-        # Write team data
-        for team in teams:
-            # Get team members count
-            members_count = len(team.members) if team.members else 0
-            
-            writer.writerow([
-                team.team_id,
-                team.team_name,
-                team.leader_name,
-                team.leader_email,
-                team.leader_contact,
-                team.status.value if team.status else "Unknown",
-                members_count,
-                team.created_at.isoformat() if team.created_at else "",
-                team.updated_at.isoformat() if team.updated_at else ""
-            ])
+        # Write team data (all rows in one writerows call)
+        writer.writerows([
+            team.team_id,
+            team.team_name,
+            team.leader_name,
+            team.leader_email,
+            team.leader_contact,
+            team.status.value if team.status else "Unknown",
+            len(team.members) if team.members else 0,  # Team members count
+            team.created_at.isoformat() if team.created_at else "",
+            team.updated_at.isoformat() if team.updated_at else ""
+        ] for team in teams)
         
         # Get CSV content
         csv_content = output.getvalue()
@@ -320,9 +300,7 @@ async def export_teams(
 @router.get("/{team_id}", response_model=TeamSchema)
 async def get_team(team_id: str, db: Session = Depends(get_db)):
     """Get a specific team by team_id"""
-    from sqlalchemy.orm import joinedload
-    
-    team = db.query(Team).options(joinedload(Team.members)).filter(Team.team_id == team_id).first()
+    team = db.query(Team).options(selectinload(Team.members), raiseload("*")).filter(Team.team_id == team_id).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
@@ -421,7 +399,8 @@ async def update_team(
 @router.delete("/{team_id}")
 async def delete_team(team_id: str, db: Session = Depends(get_db)):
     """Delete a team"""
-    team = db.query(Team).filter(Team.team_id == team_id).first()
+    # Members are removed by the ON DELETE CASCADE, no need to load them
+    team = db.query(Team).options(noload(Team.members)).filter(Team.team_id == team_id).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, raiseload
 from typing import List
 from app.database import get_db
 from app.models.team import Team, TeamMember, TeamStatus
@@ -14,7 +14,7 @@ async def get_teams_simple(
     db: Session = Depends(get_db)
 ):
     """Get all teams with optional filtering - simplified version"""
-    query = db.query(Team)
+    query = db.query(Team).options(selectinload(Team.members), raiseload("*"))
     
     if status:
         query = query.filter(Team.status == status)
@@ -24,8 +24,7 @@ async def get_teams_simple(
     # Simple serialization with members
     result = []
     for team in teams:
-        # Get members for this team
-        members = db.query(TeamMember).filter(TeamMember.team_id == team.team_id).all()
+        members = team.members
         
         result.append({
             "id": team.id,
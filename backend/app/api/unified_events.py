@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from sqlalchemy import text
 from typing import List, Optional
 from app.database import get_db
+from app.queries import round_by_number
 from app.models.rounds import UnifiedEvent, EventType, EventStatus, EventMode
 from app.schemas.unified_event import (
     UnifiedEventInDB, UnifiedEventCreate, UnifiedEventUpdate, 
@@ -21,7 +22,7 @@ async def get_events(
 ):
     """Get all events with their rounds"""
     # Get main events (round_number = 0)
-    query = db.query(UnifiedEvent).filter(UnifiedEvent.round_number == 0)
+    query = db.query(UnifiedEvent).options(undefer_group("detail")).filter(UnifiedEvent.round_number == 0)
     
     if event_type:
         query = query.filter(UnifiedEvent.type == event_type)
@@ -35,7 +36,7 @@ async def get_events(
     result = []
     for event in main_events:
         # Get all rounds for this event
-        rounds = db.query(UnifiedEvent).filter(
+        rounds = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
             UnifiedEvent.event_id == event.event_id,
             UnifiedEvent.round_number > 0
         ).order_by(UnifiedEvent.round_number).all()
@@ -135,7 +136,7 @@ async def get_event_stats(db: Session = Depends(get_db)):
 async def get_event(event_id: str, db: Session = Depends(get_db)):
     """Get a specific event with all its rounds"""
     # Get main event
-    event = db.query(UnifiedEvent).filter(
+    event = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
         UnifiedEvent.event_id == event_id,
         UnifiedEvent.round_number == 0
     ).first()
@@ -144,7 +145,7 @@ async def get_event(event_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Event not found")
     
     # Get all rounds for this event
-    rounds = db.query(UnifiedEvent).filter(
+    rounds = db.query(UnifiedEvent).options(undefer_group("detail")).filter(
         UnifiedEvent.event_id == event_id,
         UnifiedEvent.round_number > 0
     ).order_by(UnifiedEvent.round_number).all()
@@ -219,10 +220,7 @@ async def update_event_or_round(
     db: Session = Depends(get_db)
 ):
     """Update an event or round"""
-    event = db.query(UnifiedEvent).filter(
-        UnifiedEvent.event_id == event_id,
-        UnifiedEvent.round_number == round_number
-    ).first()
+    event = db.execute(round_by_number(event_id, round_number)).scalars().first()
     
     if not event:
         raise HTTPException(status_code=404, detail="Event or round not found")
@@ -266,10 +264,7 @@ async def delete_event(event_id: str, db: Session = Depends(get_db)):
 @router.delete("/{event_id}/{round_number}")
 async def delete_round(event_id: str, round_number: int, db: Session = Depends(get_db)):
     """Delete a specific round"""
-    round_data = db.query(UnifiedEvent).filter(
-        UnifiedEvent.event_id == event_id,
-        UnifiedEvent.round_number == round_number
-    ).first()
+    round_data = db.execute(round_by_number(event_id, round_number)).scalars().first()
     
     if not round_data:
         raise HTTPException(status_code=404, detail="Round not found")
@@ -285,6 +280,7 @@ async def delete_round(event_id: str, round_number: int, db: Session = Depends(g
     from app.models.team_score import TeamScore
     from app.models.round_weight import RoundWeight
     from app.models.evaluation import Evaluation
+    from app.models.team_totals import refresh_team_totals
     
     try:
         # Delete evaluations for this specific round
@@ -305,6 +301,9 @@ async def delete_round(event_id: str, round_number: int, db: Session = Depends(g
         ).delete()
         print(f"Deleted {round_weights_deleted} round weights for round {round_data.id}")
         
+        # Bulk deletes skip the ORM hooks, so recompute the team totals without this round's scores
+        refresh_team_totals(db.connection())
+        
         # Commit the related data deletions first
         db.commit()
         
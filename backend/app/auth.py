@@ -8,6 +8,8 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.auth import User
 from app.schemas.auth import TokenData
+from app.cache.user_cache import get_user_by_username
+from app.queries import user_by_username
 import os
 
 # Configuration
@@ -52,7 +54,7 @@ def verify_token(token: str, credentials_exception):
 
 def get_user(db: Session, username: str):
     """Get a user by username"""
-    return db.query(User).filter(User.username == username).first()
+    return db.execute(user_by_username(username)).scalars().first()
 
 def authenticate_user(db: Session, username: str, password: str):
     """Authenticate a user"""
@@ -76,7 +78,7 @@ async def get_current_user(
     
     token = credentials.credentials
     token_data = verify_token(token, credentials_exception)
-    user = get_user(db, username=token_data.username)
+    user = get_user_by_username(db, token_data.username)
     if user is None:
         raise credentials_exception
     return user
@@ -0,0 +1 @@
+# Caching layers
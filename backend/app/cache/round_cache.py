@@ -0,0 +1,50 @@
+"""
+Short-lived in-process cache of the evaluated rounds used by the leaderboard export.
+
+The export is polled by the UI while the set of evaluated rounds rarely changes.
+Entries expire after ROUND_CACHE_TTL seconds and are dropped as soon as any
+round is inserted, updated or deleted through the ORM in this process.
+"""
+
+import os
+import threading
+from typing import List, Tuple
+
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.rounds import UnifiedEvent
+
+ROUND_CACHE_TTL = int(os.getenv("ROUND_CACHE_TTL", "30"))
+
+_cache = TTLCache(maxsize=4, ttl=ROUND_CACHE_TTL)
+_lock = threading.Lock()
+
+def get_evaluated_rounds(db: Session) -> List[Tuple[int, int]]:
+    """(id, round_number) of every evaluated round, ordered by round number"""
+    with _lock:
+        rounds = _cache.get("evaluated")
+    if rounds is not None:
+        return rounds
+
+    rounds = [
+        (round_id, round_number)
+        for round_id, round_number in db.query(UnifiedEvent.id, UnifiedEvent.round_number).filter(
+            UnifiedEvent.is_evaluated == True,
+            UnifiedEvent.round_number > 0
+        ).order_by(UnifiedEvent.round_number)
+    ]
+    with _lock:
+        _cache["evaluated"] = rounds
+    return rounds
+
+def invalidate_rounds():
+    with _lock:
+        _cache.clear()
+
+@event.listens_for(UnifiedEvent, "after_insert")
+@event.listens_for(UnifiedEvent, "after_update")
+@event.listens_for(UnifiedEvent, "after_delete")
+def _invalidate_on_change(mapper, connection, target):
+    invalidate_rounds()
@@ -0,0 +1,174 @@
+"""
+Two-level cache for the User lookups done on every authenticated request.
+
+L1 is a small in-process TTL cache, L2 is Redis (shared between workers).
+Only plain column values are cached, never the ORM instance itself, and the
+password hash is left out on purpose - login still reads it from the database.
+Redis holds them as JSON, so a value written there can never run code on load.
+"""
+
+import os
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+import orjson
+import redis
+from cachetools import TTLCache
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.models.auth import User, UserRole
+from app.queries import user_by_username
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+INVALIDATION_CHANNEL = "user-cache:invalidate"
+LISTENER_RECONNECT_DELAY = 1  # seconds
+
+# Columns needed by the auth dependencies and the /auth/me response
+CACHED_FIELDS = ("id", "username", "email", "full_name", "role", "club", "is_active", "created_at", "updated_at")
+
+_local_cache = TTLCache(maxsize=4096, ttl=USER_CACHE_TTL)
+_local_lock = threading.Lock()
+
+def _cache_key(username: str) -> str:
+    return f"u:{username}"
+
+def _connect_redis():
+    """Create the Redis client and start the invalidation listener, or return None"""
+    if not REDIS_URL:
+        logger.info("REDIS_URL not set, user cache is in-process only")
+        return None
+    try:
+        client = redis.Redis.from_url(REDIS_URL)
+        client.ping()
+    except redis.RedisError as e:
+        logger.warning(f"Redis unavailable, user cache is in-process only: {e}")
+        return None
+
+    def listen():
+        while True:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Invalidations published while (re)connecting were missed, so start from an empty L1
+                with _local_lock:
+                    _local_cache.clear()
+                for message in pubsub.listen():
+                    with _local_lock:
+                        _local_cache.pop(message["data"].decode(), None)
+            except Exception as e:
+                logger.warning(f"User cache invalidation listener lost Redis, reconnecting: {e}")
+                time.sleep(LISTENER_RECONNECT_DELAY)
+            finally:
+                pubsub.close()
+
+    threading.Thread(target=listen, name="user-cache-invalidation", daemon=True).start()
+    return client
+
+_redis = _connect_redis()
+
+def _snapshot(user: User) -> dict:
+    return {field: getattr(user, field) for field in CACHED_FIELDS}
+
+def _encode(fields: dict) -> bytes:
+    return orjson.dumps({
+        **fields,
+        "role": UserRole(fields["role"]).value if fields["role"] is not None else None,
+        "created_at": fields["created_at"].isoformat() if fields["created_at"] else None,
+        "updated_at": fields["updated_at"].isoformat() if fields["updated_at"] else None,
+    })
+
+def _decode(raw: bytes) -> dict:
+    """Inverse of _encode; raises ValueError/KeyError on anything that isn't a cached user"""
+    data = orjson.loads(raw)
+    fields = {field: data[field] for field in CACHED_FIELDS}
+    fields["role"] = UserRole(fields["role"]) if fields["role"] is not None else None
+    for field in ("created_at", "updated_at"):
+        if fields[field] is not None:
+            fields[field] = datetime.fromisoformat(fields[field])
+    return fields
+
+def _to_user(fields: dict) -> User:
+    """Rebuild a transient (session-less) User from cached column values"""
+    return User(**fields)
+
+def get_user_by_username(db: Session, username: str) -> Optional[User]:
+    """Resolve a user through L1, then Redis, then the database (back-filling both caches)"""
+    with _local_lock:
+        fields = _local_cache.get(username)
+    if fields is not None:
+        return _to_user(fields)
+
+    if _redis is not None:
+        try:
+            cached = _redis.get(_cache_key(username))
+        except redis.RedisError as e:
+            logger.warning(f"Redis read failed for user cache: {e}")
+            cached = None
+        if cached is not None:
+            try:
+                fields = _decode(cached)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring malformed user cache entry: {e}")
+                fields = None
+        if fields is not None:
+            with _local_lock:
+                _local_cache[username] = fields
+            return _to_user(fields)
+
+    user = db.execute(user_by_username(username)).scalars().first()
+    if user is None:
+        return None
+
+    fields = _snapshot(user)
+    with _local_lock:
+        _local_cache[username] = fields
+    if _redis is not None:
+        try:
+            _redis.setex(_cache_key(username), USER_CACHE_TTL, _encode(fields))
+        except redis.RedisError as e:
+            logger.warning(f"Redis write failed for user cache: {e}")
+    return user
+
+def invalidate_user(username: str):
+    """Drop a user from both cache levels and tell the other workers to do the same"""
+    with _local_lock:
+        _local_cache.pop(username, None)
+    if _redis is not None:
+        try:
+            _redis.delete(_cache_key(username))
+            _redis.publish(INVALIDATION_CHANNEL, username)
+        except redis.RedisError as e:
+            logger.warning(f"Redis invalidation failed for user cache: {e}")
+
+# Usernames changed in the current transaction; evicted only once it commits, because a
+# request that reads the old committed row in between would otherwise re-cache it
+_PENDING_USERNAMES = "user_cache_pending_usernames"
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target):
+    # A renamed user must also be evicted under the old username
+    usernames = {target.username, *(inspect(target).attrs.username.history.deleted or ())}
+    session = object_session(target)
+    if session is None:
+        for username in usernames:
+            invalidate_user(username)
+    else:
+        session.info.setdefault(_PENDING_USERNAMES, set()).update(usernames)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for username in session.info.pop(_PENDING_USERNAMES, ()):
+        invalidate_user(username)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session):
+    session.info.pop(_PENDING_USERNAMES, None)
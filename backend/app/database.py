@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, String
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 import os
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,19 +16,42 @@ DB_NAME = os.getenv("DB_NAME", "crestora_db")
 
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Connection pool (SQLAlchemy's defaults are 5 + 10 overflow)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
     echo=True,  # Set to False in production
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
     pool_pre_ping=True,
-    pool_recycle=300
+    pool_recycle=300,
+    # JSON columns (criteria, criteria_scores) go through orjson instead of stdlib json
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create Base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    # Columns shown by repr(); subclasses override this
+    __repr_attrs__ = ("id",)
+
+    def __repr__(self):
+        # Read straight from the instance dict so repr() never lazy-loads or refreshes expired attributes
+        state = self.__dict__
+        fields = ", ".join(f"{name}={state.get(name, '?')!r}" for name in self.__repr_attrs__)
+        return f"<{type(self).__name__}({fields})>"
+
+def AsciiString(length: int):
+    """VARCHAR for codes/IDs/phone numbers: ascii on MySQL (1 byte per char instead of 4 in index keys)"""
+    return String(length).with_variant(
+        mysql.VARCHAR(length, charset="ascii", collation="ascii_general_ci"), "mysql"
+    )
 
 # Dependency to get database session
 def get_db():
@@ -1,10 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 
 # Import API routers
 from app.api import teams_simple, events, dashboard, teams, team_scores, leaderboard, rounds, auth, rolling_results, public_teams, public_events, team_auth
+from app.database import Base
+
+# Configure all mappers once at import time so the first request doesn't pay for it
+Base.registry.configure()
 
 app = FastAPI(
     title="Crestora'25 API",
@@ -36,6 +41,10 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
+# Gzip responses (CSV exports and large JSON lists compress well); streamed exports are compressed chunk by chunk.
+# Level 1 keeps most of the size reduction on this repetitive data at a fraction of the CPU of the default 9
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Root endpoint
 @app.get("/")
 async def root():
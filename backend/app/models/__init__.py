@@ -1,8 +1,9 @@
 # Database models
 from .team import Team, TeamMember
-from .rounds import UnifiedEvent
+from .rounds import UnifiedEvent, RoundCriterion, ShortlistedTeam
 from .evaluation import Evaluation
 from .rolling_member import RollingEventMember, RollingMemberStatus
-from .rolling_results import RollingEventResult
+from .rolling_results import RollingEventResult, DepartmentLookup, YearLevel
 from .team_score import TeamScore
 from .round_weight import RoundWeight
+from . import team_totals  # registers the Team.current_total_score sync hooks
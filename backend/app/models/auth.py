@@ -12,10 +12,10 @@ class UserRole(str, enum.Enum):
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
-    hashed_password = Column(String(255), nullable=False)
+    hashed_password = Column(String(100), nullable=False)
     full_name = Column(String(100), nullable=False)
     role = Column(Enum(UserRole), default=UserRole.CLUBS)
     club = Column(String(100), nullable=True)  # Club name for club users
@@ -23,5 +23,4 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    def __repr__(self):
-        return f"<User(username='{self.username}', role='{self.role}')>"
+    __repr_attrs__ = ("username", "role")
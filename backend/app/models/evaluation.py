@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, Identity, String, DateTime, Enum, ForeignKey, Text, Numeric
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, AsciiString
 import enum
 
 class EvaluationStatus(str, enum.Enum):
@@ -12,14 +12,15 @@ class EvaluationStatus(str, enum.Enum):
 class Evaluation(Base):
     __tablename__ = "evaluations"
 
-    id = Column(Integer, primary_key=True, index=True)
-    team_id = Column(String(20), ForeignKey("teams.team_id"), nullable=False)
-    event_id = Column(String(20), ForeignKey("events.event_id"), nullable=False)
+    # 64-bit key, same as team_scores (SQLite needs INTEGER for rowid autoincrement)
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), Identity(start=1, cache=200), primary_key=True)
+    team_id = Column(AsciiString(20), ForeignKey("teams.team_id"), nullable=False)
+    event_id = Column(AsciiString(20), ForeignKey("events.event_id"), nullable=False)
     round_id = Column(Integer, ForeignKey("rounds.id"), nullable=False)
     evaluator_name = Column(String(100), nullable=False)
-    score = Column(Float, nullable=False)
-    max_score = Column(Float, default=100.0)
-    feedback = Column(Text)
+    score = Column(Numeric(5, 2, asdecimal=False), nullable=False)
+    max_score = Column(Numeric(5, 2, asdecimal=False), default=100.0)
+    feedback = deferred(Column(Text), group="detail")
     status = Column(Enum(EvaluationStatus), default=EvaluationStatus.PENDING)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -29,5 +30,4 @@ class Evaluation(Base):
     # event = relationship("Event", back_populates="evaluations")  # Commented out for now
     # round = relationship("Round", back_populates="evaluations")  # Commented out for now
 
-    def __repr__(self):
-        return f"<Evaluation(team_id='{self.team_id}', score={self.score})>"
+    __repr_attrs__ = ("team_id", "score")
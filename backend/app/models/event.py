@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Date
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.database import Base
 import enum
@@ -25,7 +25,7 @@ class RoundStatus(str, enum.Enum):
 class Event(Base):
     __tablename__ = "events"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     event_id = Column(String(20), unique=True, nullable=False, index=True)
     name = Column(String(200), nullable=False)
     event_code = Column(String(20), nullable=False)
@@ -34,29 +34,28 @@ class Event(Base):
     start_date = Column(Date)
     end_date = Column(Date)
     venue = Column(String(200))
-    description = Column(Text)
+    description = deferred(Column(Text), group="detail")
     max_rounds = Column(Integer, default=1)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    rounds = relationship("Round", back_populates="event", cascade="all, delete-orphan")
+    rounds = relationship("Round", back_populates="event", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
     # evaluations = relationship("Evaluation", back_populates="event")  # Commented out for now
 
-    def __repr__(self):
-        return f"<Event(event_id='{self.event_id}', name='{self.name}')>"
+    __repr_attrs__ = ("event_id", "name")
 
 class Round(Base):
     __tablename__ = "rounds"
 
-    id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(String(20), ForeignKey("events.event_id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    event_id = Column(String(20), ForeignKey("events.event_id", ondelete="CASCADE"), nullable=False)
     round_number = Column(Integer, nullable=False)
     name = Column(String(200), nullable=False)
     club = Column(String(100))
     type = Column(Enum(RoundType), nullable=False)
     date = Column(Date)
-    description = Column(Text)
+    description = deferred(Column(Text), group="detail")
     status = Column(Enum(RoundStatus), default=RoundStatus.UPCOMING)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -65,5 +64,4 @@ class Round(Base):
     event = relationship("Event", back_populates="rounds")
     # evaluations = relationship("Evaluation", back_populates="round")  # Commented out for now
 
-    def __repr__(self):
-        return f"<Round(round_number={self.round_number}, name='{self.name}')>"
+    __repr_attrs__ = ("round_number", "name")
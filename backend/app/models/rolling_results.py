@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Boolean, ForeignKey, event, insert
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, AsciiString
 import enum
 
 class Department(str, enum.Enum):
@@ -22,27 +22,85 @@ class Year(str, enum.Enum):
     THIRD = "3"
     FOURTH = "4"
 
+# Lookup table ids, stored in rolling_event_results. They are pinned per member (not derived
+# from enum order), so never renumber one; a new member takes the next unused id and is seeded
+# into its table with it
+DEPARTMENT_IDS = {
+    Department.AI_DS: 1,
+    Department.AEROSPACE: 2,
+    Department.AUTOMOBILE: 3,
+    Department.COMPUTER_TECH: 4,
+    Department.ECE: 5,
+    Department.EIE: 6,
+    Department.PRODUCTION: 7,
+    Department.ROBOTICS: 8,
+    Department.RUBBER_PLASTICS: 9,
+    Department.IT: 10,
+}
+DEPARTMENTS_BY_ID = {index: department for department, index in DEPARTMENT_IDS.items()}
+YEAR_IDS = {
+    Year.FIRST: 1,
+    Year.SECOND: 2,
+    Year.THIRD: 3,
+    Year.FOURTH: 4,
+}
+YEARS_BY_ID = {index: year for year, index in YEAR_IDS.items()}
+
+class DepartmentLookup(Base):
+    """Department a rolling event winner/runner-up belongs to"""
+    __tablename__ = "departments"
+
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    code = Column(String(16), unique=True, nullable=False)  # Department enum name, e.g. AI_DS
+    display_name = Column(String(80), nullable=False)
+
+    __repr_attrs__ = ("code",)
+
+class YearLevel(Base):
+    """Year of study of a rolling event winner/runner-up"""
+    __tablename__ = "year_levels"
+
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    code = Column(String(8), unique=True, nullable=False)  # Year enum name, e.g. FIRST
+    display_name = Column(String(80), nullable=False)
+
+    __repr_attrs__ = ("code",)
+
+@event.listens_for(DepartmentLookup.__table__, "after_create")
+def _seed_departments(table, connection, **kw):
+    connection.execute(insert(table), [
+        {"id": index, "code": department.name, "display_name": department.value}
+        for department, index in DEPARTMENT_IDS.items()
+    ])
+
+@event.listens_for(YearLevel.__table__, "after_create")
+def _seed_year_levels(table, connection, **kw):
+    connection.execute(insert(table), [
+        {"id": index, "code": year.name, "display_name": year.value}
+        for year, index in YEAR_IDS.items()
+    ])
+
 class RollingEventResult(Base):
     __tablename__ = "rolling_event_results"
 
-    id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(String(20), nullable=False, index=True)  # Links to rolling events
+    id = Column(Integer, primary_key=True)
+    event_id = Column(AsciiString(20), nullable=False, index=True)  # Links to rolling events
     
     # Winner details
     winner_name = Column(String(100), nullable=False)
-    winner_register_number = Column(String(20), nullable=False)
+    winner_register_number = Column(AsciiString(20), nullable=False)
     winner_email = Column(String(100), nullable=False)
-    winner_phone = Column(String(15), nullable=False)
-    winner_department = Column(Enum(Department), nullable=False)
-    winner_year = Column(Enum(Year), nullable=False)
+    winner_phone = Column(AsciiString(15), nullable=False)
+    winner_department_id = Column(SmallInteger, ForeignKey("departments.id"), nullable=False)
+    winner_year_id = Column(SmallInteger, ForeignKey("year_levels.id"), nullable=False)
     
     # Runner-up details
     runner_up_name = Column(String(100), nullable=False)
-    runner_up_register_number = Column(String(20), nullable=False)
+    runner_up_register_number = Column(AsciiString(20), nullable=False)
     runner_up_email = Column(String(100), nullable=False)
-    runner_up_phone = Column(String(15), nullable=False)
-    runner_up_department = Column(Enum(Department), nullable=False)
-    runner_up_year = Column(Enum(Year), nullable=False)
+    runner_up_phone = Column(AsciiString(15), nullable=False)
+    runner_up_department_id = Column(SmallInteger, ForeignKey("departments.id"), nullable=False)
+    runner_up_year_id = Column(SmallInteger, ForeignKey("year_levels.id"), nullable=False)
     
     club = Column(String(100), nullable=False)  # Organizing club
     is_frozen = Column(Boolean, default=False)
@@ -50,5 +108,43 @@ class RollingEventResult(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    def __repr__(self):
-        return f"<RollingEventResult(event_id='{self.event_id}', winner='{self.winner_name}', runner_up='{self.runner_up_name}')>"
+    # Relationships (only needed for the display rows; the properties below resolve ids without a join)
+    winner_department_ref = relationship("DepartmentLookup", foreign_keys=[winner_department_id])
+    winner_year_ref = relationship("YearLevel", foreign_keys=[winner_year_id])
+    runner_up_department_ref = relationship("DepartmentLookup", foreign_keys=[runner_up_department_id])
+    runner_up_year_ref = relationship("YearLevel", foreign_keys=[runner_up_year_id])
+
+    __repr_attrs__ = ("event_id", "winner_name", "runner_up_name")
+
+    # Enum-valued accessors so schemas, routes and exports keep working with Department/Year
+    @property
+    def winner_department(self):
+        return DEPARTMENTS_BY_ID.get(self.winner_department_id)
+
+    @winner_department.setter
+    def winner_department(self, value):
+        self.winner_department_id = DEPARTMENT_IDS[Department(value)]
+
+    @property
+    def winner_year(self):
+        return YEARS_BY_ID.get(self.winner_year_id)
+
+    @winner_year.setter
+    def winner_year(self, value):
+        self.winner_year_id = YEAR_IDS[Year(value)]
+
+    @property
+    def runner_up_department(self):
+        return DEPARTMENTS_BY_ID.get(self.runner_up_department_id)
+
+    @runner_up_department.setter
+    def runner_up_department(self, value):
+        self.runner_up_department_id = DEPARTMENT_IDS[Department(value)]
+
+    @property
+    def runner_up_year(self):
+        return YEARS_BY_ID.get(self.runner_up_year_id)
+
+    @runner_up_year.setter
+    def runner_up_year(self, value):
+        self.runner_up_year_id = YEAR_IDS[Year(value)]
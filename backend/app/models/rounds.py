@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, Date, Boolean, Float, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, Date, Boolean, Numeric, ForeignKey
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, AsciiString
 import enum
 
 class EventType(str, enum.Enum):
@@ -25,11 +26,11 @@ class UnifiedEvent(Base):
     """
     __tablename__ = "rounds"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Event identification
-    event_id = Column(String(20), nullable=False, index=True)  # Same for all rounds of an event
-    event_code = Column(String(20), nullable=False)  # Same for all rounds of an event
+    event_id = Column(AsciiString(20), nullable=False, index=True)  # Same for all rounds of an event
+    event_code = Column(AsciiString(20), nullable=False)  # Same for all rounds of an event
     
     # Round identification (0 = main event, 1+ = specific rounds)
     round_number = Column(Integer, nullable=False, default=0)
@@ -50,9 +51,9 @@ class UnifiedEvent(Base):
     # Location
     venue = Column(String(200), nullable=True)
     
-    # Content
-    description = Column(Text, nullable=True)
-    extended_description = Column(Text, nullable=True)
+    # Content (deferred: list/leaderboard queries never need it, detail endpoints use undefer_group("detail"))
+    description = deferred(Column(Text, nullable=True), group="detail")
+    extended_description = deferred(Column(Text, nullable=True), group="detail")
     form_link = Column(String(500), nullable=True)
     contact = Column(String(200), nullable=True)
     
@@ -60,26 +61,42 @@ class UnifiedEvent(Base):
     status = Column(Enum(EventStatus), default=EventStatus.UPCOMING)
     
     # Round-specific fields
-    round_code = Column(String(50), unique=True, nullable=True, index=True)
+    round_code = Column(AsciiString(50), unique=True, nullable=True, index=True)
     participated_count = Column(Integer, default=0)
-    shortlisted_teams = Column(JSON, nullable=True)  # Array of team_ids
     is_evaluated = Column(Boolean, default=False)
     is_frozen = Column(Boolean, default=False)
     is_wildcard = Column(Boolean, default=False)  # Wildcard round for eliminated teams
-    criteria = Column(JSON, nullable=True)  # Array of {name, max_points}
-    max_score = Column(Float, nullable=True)
-    min_score = Column(Float, nullable=True)
-    avg_score = Column(Float, nullable=True)
+    max_score = Column(Numeric(5, 2, asdecimal=False), nullable=True)
+    min_score = Column(Numeric(5, 2, asdecimal=False), nullable=True)
+    avg_score = Column(Numeric(5, 2, asdecimal=False), nullable=True)
+    # Sum of the criteria max_points (NULL when no criteria), kept in step by the criteria setter
+    max_possible_score = Column(Numeric(8, 2, asdecimal=False), nullable=True)
+    # When the criteria were last set (NULL = never set; an empty list still has a time)
+    criteria_set_at = Column(DateTime(timezone=True), nullable=True)
+    # When the shortlist was last set (NULL = never shortlisted; an empty shortlist still has a time)
+    shortlisted_at = Column(DateTime(timezone=True), nullable=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Relationships (load with selectinload() where the whole list is serialized)
+    criteria_items = relationship(
+        "RoundCriterion", back_populates="round", cascade="all, delete-orphan",
+        passive_deletes=True, order_by="RoundCriterion.ordinal"
+    )
+    shortlisted_team_items = relationship(
+        "ShortlistedTeam", back_populates="round", cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
     def __repr__(self):
-        if self.round_number == 0:
-            return f"<Event(event_id='{self.event_id}', name='{self.name}')>"
+        # Same __dict__ access as Base.__repr__ so an expired instance doesn't issue a SELECT
+        state = self.__dict__
+        if state.get("round_number") == 0:
+            return f"<Event(event_id={state.get('event_id', '?')!r}, name={state.get('name', '?')!r})>"
         else:
-            return f"<Round(event_id='{self.event_id}', round={self.round_number}, name='{self.name}')>"
+            return f"<Round(event_id={state.get('event_id', '?')!r}, round={state.get('round_number', '?')}, name={state.get('name', '?')!r})>"
 
     @property
     def is_main_event(self):
@@ -90,3 +107,63 @@ class UnifiedEvent(Base):
     def is_round(self):
         """Returns True if this is a specific round record (round_number > 0)"""
         return self.round_number > 0
+
+    @property
+    def criteria(self):
+        """Evaluation criteria as a list of {name, max_points} dicts (None if never set, [] if set to none)"""
+        if self.criteria_set_at is None:
+            return None
+        return [{"name": c.name, "max_points": c.max_points} for c in self.criteria_items]
+
+    @criteria.setter
+    def criteria(self, criteria):
+        self.criteria_items = [
+            RoundCriterion(
+                ordinal=ordinal,
+                name=criterion.get("name", "Unknown"),
+                max_points=criterion.get("max_points", 0)
+            )
+            for ordinal, criterion in enumerate(criteria or [])
+        ]
+        self.max_possible_score = (
+            sum(item.max_points or 0 for item in self.criteria_items) if self.criteria_items else None
+        )
+        self.criteria_set_at = None if criteria is None else func.now()
+
+    @property
+    def shortlisted_teams(self):
+        """Shortlisted team_ids for this round (None if not shortlisted yet, [] if nobody was kept)"""
+        if self.shortlisted_at is None:
+            return None
+        return [item.team_id for item in self.shortlisted_team_items]
+
+    @shortlisted_teams.setter
+    def shortlisted_teams(self, team_ids):
+        self.shortlisted_team_items = [ShortlistedTeam(team_id=team_id) for team_id in team_ids or []]
+        self.shortlisted_at = None if team_ids is None else func.now()
+
+class RoundCriterion(Base):
+    """A single evaluation criterion of a round"""
+    __tablename__ = "round_criteria"
+
+    round_id = Column(Integer, ForeignKey("rounds.id", ondelete="CASCADE"), primary_key=True)
+    ordinal = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    max_points = Column(Numeric(6, 2, asdecimal=False), nullable=False, default=0.0)
+
+    # Relationships
+    round = relationship("UnifiedEvent", back_populates="criteria_items")
+
+    __repr_attrs__ = ("round_id", "name", "max_points")
+
+class ShortlistedTeam(Base):
+    """Membership of a team in a round's shortlist"""
+    __tablename__ = "round_shortlisted_teams"
+
+    round_id = Column(Integer, ForeignKey("rounds.id", ondelete="CASCADE"), primary_key=True)
+    team_id = Column(AsciiString(20), ForeignKey("teams.team_id", ondelete="CASCADE"), primary_key=True)
+
+    # Relationships
+    round = relationship("UnifiedEvent", back_populates="shortlisted_team_items")
+
+    __repr_attrs__ = ("round_id", "team_id")
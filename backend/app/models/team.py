@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Numeric, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, AsciiString
 import enum
 
 class TeamStatus(str, enum.Enum):
@@ -11,39 +11,43 @@ class TeamStatus(str, enum.Enum):
 
 class Team(Base):
     __tablename__ = "teams"
+    __table_args__ = (
+        # Top-N teams by status reads straight from this index
+        Index("ix_teams_status_total_score", "status", "current_total_score"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    team_id = Column(String(20), unique=True, nullable=False, index=True)  # CRES-96DA2
+    id = Column(Integer, primary_key=True)
+    team_id = Column(AsciiString(20), unique=True, nullable=False, index=True)  # CRES-96DA2
     team_name = Column(String(100), nullable=False)
     leader_name = Column(String(100), nullable=False)
-    leader_register_number = Column(String(20), nullable=False)
-    leader_contact = Column(String(15), nullable=False)
+    leader_register_number = Column(AsciiString(20), nullable=False)
+    leader_contact = Column(AsciiString(15), nullable=False)
     leader_email = Column(String(100), nullable=False)
     password = Column(String(255), nullable=False)
     current_round = Column(Integer, default=1)
     status = Column(Enum(TeamStatus), default=TeamStatus.ACTIVE)
+    # Sum of weighted scores over frozen/evaluated rounds, kept in sync by app.models.team_totals
+    current_total_score = Column(Numeric(7, 2, asdecimal=False), nullable=False, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
+    members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
     # evaluations = relationship("Evaluation", back_populates="team")  # Commented out for now
 
-    def __repr__(self):
-        return f"<Team(team_id='{self.team_id}', team_name='{self.team_name}')>"
+    __repr_attrs__ = ("team_id", "team_name")
 
 class TeamMember(Base):
     __tablename__ = "team_members"
 
-    id = Column(Integer, primary_key=True, index=True)
-    team_id = Column(String(20), ForeignKey("teams.team_id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    team_id = Column(AsciiString(20), ForeignKey("teams.team_id", ondelete="CASCADE"), nullable=False)
     member_name = Column(String(100), nullable=False)
-    register_number = Column(String(20), nullable=False)
-    member_position = Column(String(20), nullable=False)  # leader, member2, member3, member4
+    register_number = Column(AsciiString(20), nullable=False)
+    member_position = Column(String(8), nullable=False)  # leader, member2, member3, member4
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     team = relationship("Team", back_populates="members")
 
-    def __repr__(self):
-        return f"<TeamMember(name='{self.member_name}', position='{self.member_position}')>"
+    __repr_attrs__ = ("member_name", "member_position")
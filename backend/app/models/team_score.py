@@ -1,18 +1,28 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Boolean, JSON
+from sqlalchemy import Column, Integer, BigInteger, Identity, String, DateTime, ForeignKey, Numeric, Boolean, JSON, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, AsciiString
 
 class TeamScore(Base):
     __tablename__ = "team_scores"
+    __table_args__ = (
+        # One score row per team per round
+        UniqueConstraint("round_id", "team_id", name="uq_team_scores_round_team"),
+        # Per-round leaderboards read scores in order straight from this index
+        Index("ix_team_scores_round_score", "round_id", "score"),
+        # Only PostgreSQL can index the criteria document as a whole (JSONB + GIN)
+        Index("ix_team_scores_criteria_gin", "criteria_scores", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    team_id = Column(String(20), ForeignKey("teams.team_id"), nullable=False)
+    # 64-bit key: score rows are the highest-volume inserts (SQLite needs INTEGER for rowid autoincrement)
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), Identity(start=1, cache=200), primary_key=True)
+    team_id = Column(AsciiString(20), ForeignKey("teams.team_id"), nullable=False)
     round_id = Column(Integer, ForeignKey("rounds.id"), nullable=False)
-    event_id = Column(String(20), nullable=False, index=True)
-    score = Column(Float, nullable=False, default=0.0)  # Normalized to 100
-    criteria_scores = Column(JSON, nullable=True)  # {criteria_name: score}
-    raw_total_score = Column(Float, nullable=False, default=0.0)
+    event_id = Column(AsciiString(20), nullable=False, index=True)
+    score = Column(Numeric(5, 2, asdecimal=False), nullable=False, default=0.0)  # Normalized to 100
+    criteria_scores = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # {criteria_name: score}
+    raw_total_score = Column(Numeric(7, 2, asdecimal=False), nullable=False, default=0.0)
     is_normalized = Column(Boolean, default=True)
     is_present = Column(Boolean, default=True)  # Whether team was present for evaluation
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -22,5 +32,4 @@ class TeamScore(Base):
     team = relationship("Team", foreign_keys=[team_id])
     round = relationship("UnifiedEvent", foreign_keys=[round_id])
 
-    def __repr__(self):
-        return f"<TeamScore(team_id='{self.team_id}', round_id={self.round_id}, score={self.score})>"
+    __repr_attrs__ = ("team_id", "round_id", "score")
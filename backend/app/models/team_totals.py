@@ -0,0 +1,95 @@
+"""
+Keeps Team.current_total_score in sync with the rows it is derived from.
+
+The total is the leaderboard's weighted score: the sum of
+score * weight_percentage / 100 over the team's scores in rounds that are
+frozen or evaluated (rounds without a weight count at 100%). It is recomputed
+in SQL at the end of every flush in which a score, a round weight or a round's
+frozen/evaluated state changed (or a round was deleted) through the ORM. Core
+statements and bulk Query.update()/delete() (e.g. the score deletes in
+delete_round) bypass these hooks, so their callers use refresh_team_totals()
+directly.
+"""
+
+from sqlalchemy import event, select, update, func, or_, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, object_session
+from typing import Iterable, Optional
+from app.models.team import Team
+from app.models.team_score import TeamScore
+from app.models.round_weight import RoundWeight
+from app.models.rounds import UnifiedEvent
+
+def _weighted_total_for_team():
+    """Correlated subquery: weighted score sum of the team being updated"""
+    return select(
+        func.coalesce(
+            func.sum(TeamScore.score * func.coalesce(RoundWeight.weight_percentage, 100.0) / 100.0),
+            0.0
+        )
+    ).select_from(TeamScore).join(
+        UnifiedEvent, UnifiedEvent.id == TeamScore.round_id
+    ).outerjoin(
+        RoundWeight, RoundWeight.round_id == TeamScore.round_id
+    ).where(
+        TeamScore.team_id == Team.team_id,
+        UnifiedEvent.round_number > 0,
+        or_(UnifiedEvent.is_evaluated == True, UnifiedEvent.is_frozen == True)
+    ).correlate(Team).scalar_subquery()
+
+def refresh_team_totals(connection: Connection, team_ids: Optional[Iterable[str]] = None):
+    """Recompute current_total_score for the given teams (all teams when team_ids is None) in one UPDATE"""
+    teams = Team.__table__
+    # updated_at is set to itself so this bookkeeping doesn't fire its onupdate
+    stmt = update(teams).values(current_total_score=_weighted_total_for_team(), updated_at=teams.c.updated_at)
+    if team_ids is not None:
+        team_ids = list(team_ids)
+        if not team_ids:
+            return
+        stmt = stmt.where(Team.team_id.in_(team_ids))
+    connection.execute(stmt)
+
+# Mapper hooks only record which totals went stale; the recompute runs once per flush
+_PENDING_TEAMS = "team_totals_pending_teams"
+_PENDING_ALL = "team_totals_pending_all"
+
+def _mark_stale(connection: Connection, target, team_id: Optional[str] = None):
+    session = object_session(target)
+    if session is None:
+        # Not flushed through a Session: nothing to batch with, refresh right away
+        refresh_team_totals(connection, None if team_id is None else [team_id])
+    elif team_id is None:
+        session.info[_PENDING_ALL] = True
+    else:
+        session.info.setdefault(_PENDING_TEAMS, set()).add(team_id)
+
+@event.listens_for(TeamScore, "after_insert")
+@event.listens_for(TeamScore, "after_update")
+@event.listens_for(TeamScore, "after_delete")
+def _team_score_changed(mapper, connection, target):
+    _mark_stale(connection, target, target.team_id)
+
+@event.listens_for(RoundWeight, "after_insert")
+@event.listens_for(RoundWeight, "after_update")
+@event.listens_for(RoundWeight, "after_delete")
+def _round_weight_changed(mapper, connection, target):
+    _mark_stale(connection, target)
+
+@event.listens_for(UnifiedEvent, "after_update")
+def _round_state_changed(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("is_frozen", "is_evaluated", "round_number")):
+        _mark_stale(connection, target)
+
+@event.listens_for(UnifiedEvent, "after_delete")
+def _round_deleted(mapper, connection, target):
+    _mark_stale(connection, target)
+
+@event.listens_for(Session, "after_flush")
+def _refresh_stale_totals(session, flush_context):
+    refresh_all = session.info.pop(_PENDING_ALL, False)
+    team_ids = session.info.pop(_PENDING_TEAMS, None)
+    if refresh_all:
+        refresh_team_totals(session.connection())
+    elif team_ids:
+        refresh_team_totals(session.connection(), team_ids)
@@ -25,7 +25,7 @@ class UnifiedEvent(Base):
     """
     __tablename__ = "rounds"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Event identification
     event_id = Column(String(20), nullable=False, index=True)  # Same for all rounds of an event
@@ -76,10 +76,12 @@ class UnifiedEvent(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     def __repr__(self):
-        if self.round_number == 0:
-            return f"<Event(event_id='{self.event_id}', name='{self.name}')>"
+        # Same __dict__ access as Base.__repr__ so an expired instance doesn't issue a SELECT
+        state = self.__dict__
+        if state.get("round_number") == 0:
+            return f"<Event(event_id={state.get('event_id', '?')!r}, name={state.get('name', '?')!r})>"
         else:
-            return f"<Round(event_id='{self.event_id}', round={self.round_number}, name='{self.name}')>"
+            return f"<Round(event_id={state.get('event_id', '?')!r}, round={state.get('round_number', '?')}, name={state.get('name', '?')!r})>"
 
     @property
     def is_main_event(self):
@@ -0,0 +1,31 @@
+"""
+Hot lookups built with lambda_stmt(), so SQLAlchemy compiles each of them once
+and afterwards only binds new parameter values.
+
+Usage: db.execute(user_by_username(username)).scalars().first()
+"""
+
+from sqlalchemy import lambda_stmt, select
+from app.models.auth import User
+from app.models.team import Team
+from app.models.rounds import UnifiedEvent
+from app.models.team_score import TeamScore
+
+def user_by_username(username: str):
+    """User with the given username"""
+    return lambda_stmt(lambda: select(User).where(User.username == username))
+
+def team_by_team_id(team_id: str):
+    """Team with the given team_id (e.g. CRES-96DA2)"""
+    return lambda_stmt(lambda: select(Team).where(Team.team_id == team_id))
+
+def round_by_number(event_id: str, round_number: int):
+    """Event row (round_number 0) or round row of an event"""
+    return lambda_stmt(lambda: select(UnifiedEvent).where(
+        UnifiedEvent.event_id == event_id,
+        UnifiedEvent.round_number == round_number
+    ))
+
+def scores_for_round(round_id: int):
+    """All team scores of a round"""
+    return lambda_stmt(lambda: select(TeamScore).where(TeamScore.round_id == round_id))
@@ -2,16 +2,23 @@ from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
-class TeamScoreBase(BaseModel):
-    team_id: str = Field(..., max_length=20)
+class TeamScoreReadBase(BaseModel):
+    # No length/range constraints: rows read back from the database are already valid
+    team_id: str
     round_id: int
-    event_id: str = Field(..., max_length=20)
-    score: float = Field(..., ge=0, le=100)  # Normalized to 100
+    event_id: str
+    score: float  # Normalized to 100
     criteria_scores: Optional[Dict[str, float]] = None
-    raw_total_score: float = Field(..., ge=0)
+    raw_total_score: float
     is_normalized: bool = True
     is_present: bool = True
 
+class TeamScoreBase(TeamScoreReadBase):
+    team_id: str = Field(..., max_length=20)
+    event_id: str = Field(..., max_length=20)
+    score: float = Field(..., ge=0, le=100)  # Normalized to 100
+    raw_total_score: float = Field(..., ge=0)
+
 class TeamScoreCreate(TeamScoreBase):
     pass
 
@@ -22,7 +29,7 @@ class TeamScoreUpdate(BaseModel):
     is_normalized: Optional[bool] = None
     is_present: Optional[bool] = None
 
-class TeamScoreInDB(TeamScoreBase):
+class TeamScoreInDB(TeamScoreReadBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -3,35 +3,52 @@ from typing import List, Optional, Dict, Any, Union
 from datetime import date, datetime
 from app.models.rounds import EventType, EventStatus, EventMode
 
-class UnifiedEventBase(BaseModel):
-    event_id: str = Field(..., max_length=20)
-    event_code: str = Field(..., max_length=20)
-    round_number: int = Field(..., ge=0)
-    name: str = Field(..., max_length=200)
+class CriterionItem(BaseModel):
+    """Single evaluation criterion of a round"""
+    name: str
+    max_points: float = 0
+
+class UnifiedEventReadBase(BaseModel):
+    # Read-only: constraints are checked on create/update, not when rows are read back
+    event_id: str
+    event_code: str
+    round_number: int
+    name: str
     type: EventType
     mode: Optional[EventMode] = None
-    club: Optional[str] = Field(None, max_length=100)
+    club: Optional[str] = None
     date: Optional[date] = None
     start_date: Optional[date] = None
     end_date: Optional[date] = None
-    venue: Optional[str] = Field(None, max_length=200)
+    venue: Optional[str] = None
     description: Optional[str] = None
     extended_description: Optional[str] = None
-    form_link: Optional[str] = Field(None, max_length=500)
-    contact: Optional[str] = Field(None, max_length=200)
+    form_link: Optional[str] = None
+    contact: Optional[str] = None
     status: EventStatus = EventStatus.UPCOMING
     # Round-specific fields
-    round_code: Optional[str] = Field(None, max_length=50)
+    round_code: Optional[str] = None
     participated_count: int = 0
-    shortlisted_teams: Optional[List[str]] = None  # Array of team_ids
+    shortlisted_teams: Optional[List[str]] = None
     is_evaluated: bool = False
     is_frozen: bool = False
-    is_wildcard: bool = False  # Wildcard round for eliminated teams
-    criteria: Optional[List[Dict[str, Any]]] = None  # Array of {name, max_points}
+    is_wildcard: bool = False
+    criteria: Optional[List[CriterionItem]] = None
     max_score: Optional[float] = None
     min_score: Optional[float] = None
     avg_score: Optional[float] = None
 
+class UnifiedEventBase(UnifiedEventReadBase):
+    event_id: str = Field(..., max_length=20)
+    event_code: str = Field(..., max_length=20)
+    round_number: int = Field(..., ge=0)
+    name: str = Field(..., max_length=200)
+    club: Optional[str] = Field(None, max_length=100)
+    venue: Optional[str] = Field(None, max_length=200)
+    form_link: Optional[str] = Field(None, max_length=500)
+    contact: Optional[str] = Field(None, max_length=200)
+    round_code: Optional[str] = Field(None, max_length=50)
+
 class UnifiedEventCreate(UnifiedEventBase):
     pass
 
@@ -54,39 +71,13 @@ class UnifiedEventUpdate(BaseModel):
     is_evaluated: Optional[bool] = None
     is_frozen: Optional[bool] = None
     is_wildcard: Optional[bool] = None
-    criteria: Optional[List[Dict[str, Any]]] = None
+    criteria: Optional[List[CriterionItem]] = None
     max_score: Optional[float] = None
     min_score: Optional[float] = None
     avg_score: Optional[float] = None
 
-class UnifiedEventInDB(BaseModel):
+class UnifiedEventInDB(UnifiedEventReadBase):
     id: int
-    event_id: str = Field(..., max_length=20)
-    event_code: str = Field(..., max_length=20)
-    round_number: int = Field(..., ge=0)
-    name: str = Field(..., max_length=200)
-    type: EventType
-    mode: Optional[EventMode] = None
-    club: Optional[str] = Field(None, max_length=100)
-    date: Optional[date] = None
-    start_date: Optional[date] = None
-    end_date: Optional[date] = None
-    venue: Optional[str] = Field(None, max_length=200)
-    description: Optional[str] = None
-    extended_description: Optional[str] = None
-    form_link: Optional[str] = Field(None, max_length=500)
-    contact: Optional[str] = Field(None, max_length=200)
-    status: EventStatus = EventStatus.UPCOMING
-    round_code: Optional[str] = Field(None, max_length=50)
-    participated_count: int = 0
-    shortlisted_teams: Optional[List[str]] = None
-    is_evaluated: bool = False
-    is_frozen: bool = False
-    is_wildcard: bool = False
-    criteria: Optional[List[Dict[str, Any]]] = None
-    max_score: Optional[float] = None
-    min_score: Optional[float] = None
-    avg_score: Optional[float] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -115,7 +106,7 @@ class RoundInDB(BaseModel):
     is_evaluated: bool = False
     is_frozen: bool = False
     is_wildcard: bool = False
-    criteria: Optional[List[Dict[str, Any]]] = None
+    criteria: Optional[List[CriterionItem]] = None
     max_score: Optional[float] = None
     min_score: Optional[float] = None
     avg_score: Optional[float] = None
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+import logging
+
+from app.database import SessionLocal
+from app.services.export_service import ExportService
+from app.services.s3_service import s3_service
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs (and their CSV on disk or in S3) are dropped this many seconds after they finish
+EXPORT_JOB_TTL = int(os.getenv('EXPORT_JOB_TTL', '3600'))
+
+class ExportJobService:
+    """Runs CSV exports outside the request and keeps track of their status"""
+
+    def __init__(self):
+        self.export_dir = os.getenv('EXPORT_DIR', os.path.join(tempfile.gettempdir(), 'crestora-exports'))
+        self._jobs: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def create_round_export_job(self, round_id: int, sort_by: str, requested_by: str) -> dict:
+        """Register a pending round export and return the job record"""
+        self._prune()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": "pending",
+            "round_id": round_id,
+            "sort_by": sort_by,
+            "requested_by": requested_by,
+            "file_name": f"round_{round_id}_evaluations.csv",
+            "file_path": None,
+            "file_key": None,
+            "download_url": None,
+            "error": None,
+            "created_at": datetime.utcnow().isoformat(),
+            "finished_at": None
+        }
+        with self._lock:
+            self._jobs[job["job_id"]] = job
+        return job
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        self._prune()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def get_download_url(self, job: dict) -> Optional[str]:
+        """Download URL of a completed job; S3 links are presigned afresh because they expire"""
+        if job["file_key"]:
+            return s3_service.get_file_url(job["file_key"])
+        return job["download_url"]
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            self._jobs[job_id].update(fields)
+
+    def _prune(self):
+        """Forget finished jobs older than EXPORT_JOB_TTL and delete their files"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                self._jobs.pop(job_id) for job_id, job in list(self._jobs.items())
+                if job["finished_at"] is not None and now - job["finished_at"] > EXPORT_JOB_TTL
+            ]
+            live_files = {job["file_path"] for job in self._jobs.values() if job["file_path"]}
+        for job in expired:
+            try:
+                if job["file_path"]:
+                    os.remove(job["file_path"])
+                elif job["file_key"]:
+                    s3_service.delete_file(job["file_key"])
+            except Exception as e:
+                logger.warning(f"Could not remove export file of job {job['job_id']}: {str(e)}")
+
+        # CSVs left behind by an earlier process (its job records are gone)
+        if os.path.isdir(self.export_dir):
+            cutoff = time.time() - EXPORT_JOB_TTL
+            for entry in os.scandir(self.export_dir):
+                try:
+                    if (entry.name.endswith(".csv") and entry.path not in live_files
+                            and entry.stat().st_mtime < cutoff):
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def run_round_export(self, job_id: str):
+        """Write the round export to disk (and S3 when configured); runs as a background task"""
+        job = self.get_job(job_id)
+        self._update(job_id, status="running")
+
+        db = SessionLocal()
+        try:
+            os.makedirs(self.export_dir, exist_ok=True)
+            file_path = os.path.join(self.export_dir, f"{job_id}.csv")
+            with open(file_path, "w", encoding="utf-8", newline="") as csv_file:
+                ExportService(db).write_round_data_csv(job["round_id"], csv_file, job["sort_by"])
+
+            if s3_service.s3_client:
+                with open(file_path, "rb") as csv_file:
+                    result = s3_service.upload_file(csv_file.read(), f"{job_id}_{job['file_name']}", "exports/")
+                os.remove(file_path)
+                self._update(job_id, status="completed", file_key=result["file_key"], finished_at=time.monotonic())
+            else:
+                self._update(
+                    job_id, status="completed", file_path=file_path,
+                    download_url=f"/api/rounds/exports/{job_id}/download", finished_at=time.monotonic()
+                )
+            logger.info(f"Export job {job_id} completed for round {job['round_id']}")
+        except Exception as e:
+            logger.error(f"Export job {job_id} failed: {str(e)}")
+            self._update(job_id, status="failed", error=str(e), finished_at=time.monotonic())
+        finally:
+            db.close()
+
+# Global instance
+export_job_service = ExportJobService()
@@ -1,183 +1,219 @@
-from fastapi import Response
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Dict, Any
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import and_, func, select
+from typing import List, Dict, Any, Iterator, TextIO
 from app.models.team_score import TeamScore
-from app.models.team import Team
+from app.models.team import Team, TeamStatus
 from app.models.rounds import UnifiedEvent
 from app.models.round_weight import RoundWeight
-from app.models.rolling_results import RollingEventResult
+from app.models.rolling_results import RollingEventResult, DEPARTMENTS_BY_ID, YEARS_BY_ID
+from app.cache.round_cache import get_evaluated_rounds
 import csv
 import io
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+
+# Number of CSV rows formatted and sent to the client per response chunk
+CSV_CHUNK_ROWS = 1000
+
+def csv_chunks(header: list, rows: Iterator[list], size: int = CSV_CHUNK_ROWS) -> Iterator[str]:
+    """Format rows with one csv writerows() call per chunk and yield each chunk as text"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for batch in iter(lambda: list(islice(rows, size)), []):
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        # Header only (no rows)
+        yield buffer.getvalue()
+
+ROLLING_RESULTS_HEADER = [
+    "Event ID", "Event Name", "Club", "Winner Name", "Winner Register Number",
+    "Winner Email", "Winner Phone", "Winner Department", "Winner Year",
+    "Runner-up Name", "Runner-up Register Number", "Runner-up Email", 
+    "Runner-up Phone", "Runner-up Department", "Runner-up Year",
+    "Is Frozen", "Is Evaluated", "Created At", "Updated At"
+]
 
 class ExportService:
     def __init__(self, db: Session):
         self.db = db
 
-    def export_round_data(self, round_id: int, sort_by: str = "team_name") -> Response:
+    def export_round_data(self, round_id: int, sort_by: str = "team_name") -> StreamingResponse:
         """Export round evaluations to CSV - includes ALL active teams with 0 scores for unevaluated teams"""
+        return StreamingResponse(
+            self._round_data_lines(round_id, sort_by),
+            media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename=round_{round_id}_evaluations.csv"}
+        )
+
+    def export_round_data_csv(self, round_id: int, sort_by: str = "team_name") -> bytes:
+        """Round evaluations CSV as bytes (for email attachments)"""
+        return "".join(self._round_data_lines(round_id, sort_by)).encode("utf-8")
+
+    def write_round_data_csv(self, round_id: int, file: TextIO, sort_by: str = "team_name"):
+        """Write the round evaluations CSV into an open text file (for background export jobs)"""
+        header, rows = self._round_data_query(round_id, sort_by)
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    def _round_data_lines(self, round_id: int, sort_by: str) -> Iterator[str]:
+        """Run the round export queries now and return a generator of CSV text chunks"""
+        header, rows = self._round_data_query(round_id, sort_by)
+        return csv_chunks(header, rows)
+
+    def _round_data_query(self, round_id: int, sort_by: str):
+        """Look up the round now; return the header and a generator of export rows"""
         
         # Get round information
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
+        round_obj = self.db.query(UnifiedEvent).options(
+            load_only(UnifiedEvent.id), selectinload(UnifiedEvent.criteria_items)
+        ).filter(UnifiedEvent.id == round_id).first()
         if not round_obj:
             raise ValueError("Round not found")
         
-        # Get ALL active teams
-        all_active_teams = self.db.query(Team).filter(Team.status == "ACTIVE").all()
-        
-        # Get existing team scores for this round
-        existing_scores = self.db.query(TeamScore).filter(TeamScore.round_id == round_id).all()
-        # Create a dictionary for quick lookup
-        scores_dict = {score.team_id: score for score in existing_scores}
-        
-        # Prepare data for sorting
-        team_data = []
-        for team in all_active_teams:
-            score = scores_dict.get(team.team_id)
-            team_data.append({
-                'team': team,
-                'score': score,
-                'score_value': score.score if score else 0
-            })
+        # ALL active teams joined to their score for this round (if any); sorting is done
+        # by the database so rows can be streamed in batches instead of loaded up front.
+        # Plain columns rather than ORM objects: rows are read once, no instrumented attributes
+        stmt = (
+            select(
+                Team.team_id, Team.team_name, Team.leader_name,
+                TeamScore.id, TeamScore.score, TeamScore.raw_total_score,
+                TeamScore.is_normalized, TeamScore.is_present,
+                TeamScore.created_at, TeamScore.updated_at, TeamScore.criteria_scores
+            )
+            .outerjoin(TeamScore, and_(TeamScore.team_id == Team.team_id, TeamScore.round_id == round_id))
+            .where(Team.status == TeamStatus.ACTIVE)
+        )
         
         # Sort based on the sort_by parameter
         if sort_by == "score":
             # Sort by score (descending), then by team name (ascending)
-            team_data.sort(key=lambda x: (-x['score_value'], x['team'].team_name))
+            stmt = stmt.order_by(func.coalesce(TeamScore.score, 0).desc(), Team.team_name)
         else:
             # Default: sort by team name (ascending)
-            team_data.sort(key=lambda x: x['team'].team_name)
-        
-        # Create CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
+            stmt = stmt.order_by(Team.team_name)
         
-        # Write header
+        # Build header
         header = [
             "Team ID", "Team Name", "Leader Name", "Score", "Raw Total Score", 
             "Is Normalized", "Is Present", "Created At", "Updated At"
         ]
         
+        # Criteria names are the same for every team, so work them out once
+        criteria_names = [criterion.get('name', 'Unknown') for criterion in (round_obj.criteria or [])]
+        
         # Add criteria columns if criteria are defined
-        if round_obj.criteria:
-            for criterion in round_obj.criteria:
-                header.append(f"Criteria: {criterion.get('name', 'Unknown')}")
+        header.extend(f"Criteria: {name}" for name in criteria_names)
         
-        writer.writerow(header)
+        return header, self._round_data_rows(criteria_names, stmt)
+
+    def _round_data_rows(self, criteria_names: list, stmt) -> Iterator[list]:
+        """Yield the round export rows, fetching teams in batches of 1000"""
+        zero_criteria = [0] * len(criteria_names)
+        # Teams that have NOT been evaluated - show 0 scores
+        unevaluated_columns = [
+            0,  # Score = 0
+            0,  # Raw Total Score = 0
+            False,  # Is Normalized = False
+            True,  # Is Present = True (default for unevaluated teams)
+            "",  # Created At = empty
+            ""   # Updated At = empty
+        ] + zero_criteria
+        # Reads every criterion in one C-level call when a team has scores for all of them
+        # (itemgetter only returns a tuple for two or more names)
+        if len(criteria_names) > 1:
+            pick_criteria = itemgetter(*criteria_names)
+        elif criteria_names:
+            only_name = criteria_names[0]
+            pick_criteria = lambda scores: (scores[only_name],)
+        else:
+            pick_criteria = lambda scores: ()
         
-        # Write data for ALL active teams (now sorted)
-        for item in team_data:
-            team = item['team']
-            score = item['score']
-            
-            if score:
-                # Team has been evaluated
-                row = [
-                    team.team_id,
-                    team.team_name,
-                    team.leader_name,
-                    score.score,
-                    score.raw_total_score,
-                    score.is_normalized,
-                    score.is_present,
-                    score.created_at.strftime("%Y-%m-%d %H:%M:%S") if score.created_at else "",
-                    score.updated_at.strftime("%Y-%m-%d %H:%M:%S") if score.updated_at else ""
-                ]
-                
-                # Add criteria scores
-                if round_obj.criteria and score.criteria_scores:
-                    for criterion in round_obj.criteria:
-                        criterion_name = criterion.get('name', 'Unknown')
-                        row.append(score.criteria_scores.get(criterion_name, 0))
+        rows = self.db.execute(stmt.execution_options(stream_results=True, yield_per=1000))
+        
+        # Write data for ALL active teams (already sorted)
+        for (team_id, team_name, leader_name, score_id, score, raw_total_score,
+             is_normalized, is_present, created_at, updated_at, criteria_scores) in rows:
+            if score_id is not None:
+                # Team has been evaluated (0 for all criteria if no criteria scores)
+                if not criteria_scores:
+                    criteria_values = zero_criteria
                 else:
-                    # Add 0 for all criteria if no criteria scores
-                    if round_obj.criteria:
-                        for _ in round_obj.criteria:
-                            row.append(0)
-            else:
-                # Team has NOT been evaluated - show 0 scores
+                    try:
+                        criteria_values = list(pick_criteria(criteria_scores))
+                    except KeyError:
+                        # Some criteria not scored
+                        criteria_values = [criteria_scores.get(name, 0) for name in criteria_names]
                 row = [
-                    team.team_id,
-                    team.team_name,
-                    team.leader_name,
-                    0,  # Score = 0
-                    0,  # Raw Total Score = 0
-                    False,  # Is Normalized = False
-                    True,  # Is Present = True (default for unevaluated teams)
-                    "",  # Created At = empty
-                    ""   # Updated At = empty
-                ]
-                
-                # Add 0 for all criteria
-                if round_obj.criteria:
-                    for _ in round_obj.criteria:
-                        row.append(0)
+                    team_id,
+                    team_name,
+                    leader_name,
+                    score,
+                    raw_total_score,
+                    is_normalized,
+                    is_present,
+                    created_at.isoformat(" ", "seconds") if created_at else "",
+                    updated_at.isoformat(" ", "seconds") if updated_at else ""
+                ] + criteria_values
+            else:
+                row = [team_id, team_name, leader_name] + unevaluated_columns
             
-            writer.writerow(row)
-        
-        # Get CSV content
-        csv_content = output.getvalue()
-        output.close()
-        
-        # Return CSV file
-        return Response(
-            content=csv_content,
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename=round_{round_id}_evaluations.csv"}
-        )
+            yield row
 
-    def export_leaderboard(self) -> Response:
+    def export_leaderboard(self) -> StreamingResponse:
         """Export final leaderboard to CSV"""
         
-        # Get all evaluated rounds with their weights
-        evaluated_rounds = self.db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_evaluated == True,
-            UnifiedEvent.round_number > 0
-        ).all()
+        # Get all evaluated rounds (also used for the round score columns);
+        # cached briefly because the UI polls this export
+        all_rounds = get_evaluated_rounds(self.db)
         
-        if not evaluated_rounds:
+        if not all_rounds:
             raise ValueError("No evaluated rounds found")
         
-        # Get all active teams
-        active_teams = self.db.query(Team).filter(Team.status == "active").all()
+        # Weighted totals per active team, aggregated by the database
+        weight_value = RoundWeight.weight_percentage / 100.0  # Convert to decimal
+        team_totals = self.db.execute(
+            select(
+                Team.id,
+                Team.team_id,
+                Team.team_name,
+                Team.leader_name,
+                Team.current_round,
+                Team.status,
+                func.sum(TeamScore.score * weight_value).label("total_weighted_score"),
+                func.sum(weight_value).label("total_weight"),
+                func.count(TeamScore.id).label("rounds_completed")
+            )
+            .join(TeamScore, TeamScore.team_id == Team.team_id)
+            .join(RoundWeight, RoundWeight.round_id == TeamScore.round_id)
+            .where(Team.status == TeamStatus.ACTIVE)
+            .group_by(Team.id)
+        ).all()
         
         leaderboard = []
+        current_round_updates = []
         
-        for team in active_teams:
-            # Get all scores for this team across evaluated rounds
-            team_scores = self.db.query(TeamScore).filter(
-                TeamScore.team_id == team.team_id
-            ).all()
-            
-            if not team_scores:
-                continue
-            
-            # Calculate weighted average
-            total_weighted_score = 0.0
-            total_weight = 0.0
-            rounds_completed = 0
-            
-            for score in team_scores:
-                # Get weight for this round
-                weight = self.db.query(RoundWeight).filter(
-                    RoundWeight.round_id == score.round_id
-                ).first()
-                
-                if weight:
-                    weight_value = weight.weight_percentage / 100.0  # Convert to decimal
-                    total_weighted_score += score.score * weight_value
-                    total_weight += weight_value
-                    rounds_completed += 1
+        for team in team_totals:
+            total_weighted_score = team.total_weighted_score or 0.0
+            total_weight = team.total_weight or 0.0
+            rounds_completed = team.rounds_completed
+            current_round = team.current_round
             
             if total_weight > 0:
                 # Calculate weighted average for reference
                 weighted_average = total_weighted_score / total_weight
                 
                 # Update current_round for active teams: current_round = rounds_completed + 1
-                if team.status == "ACTIVE":
-                    new_current_round = rounds_completed + 1
-                    if team.current_round != new_current_round:
-                        team.current_round = new_current_round
+                new_current_round = rounds_completed + 1
+                if current_round != new_current_round:
+                    current_round_updates.append({"id": team.id, "current_round": new_current_round})
+                    current_round = new_current_round
                 
                 # Use weighted score (sum) as the primary metric
                 final_score = total_weighted_score
@@ -190,39 +226,20 @@ class ExportService:
                     "final_score": round(final_score, 2),
                     "weighted_average": round(weighted_average, 2),
                     "rounds_completed": rounds_completed,
-                    "current_round": team.current_round,
+                    "current_round": current_round,
                     "status": team.status
                 })
         
-        # Add normalized score for reference (optional)
-        if leaderboard:
-            # Find the maximum final score (weighted score)
-            max_score = max(team["final_score"] for team in leaderboard)
-            
-            # Add normalized score for reference
-            for team in leaderboard:
-                if max_score > 0:
-                    normalized_score = (team["final_score"] / max_score) * 100
-                    team["normalized_score"] = round(normalized_score, 2)
-                else:
-                    team["normalized_score"] = 0.0
-        
         # Sort by final score (weighted score) descending
-        leaderboard.sort(key=lambda x: x["final_score"], reverse=True)
-        
-        # Add rank
-        for i, team in enumerate(leaderboard):
-            team["rank"] = i + 1
-        
-        # Create CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
+        leaderboard.sort(key=itemgetter("final_score"), reverse=True)
         
-        # Get all evaluated rounds for column headers
-        all_rounds = self.db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_evaluated == True,
-            UnifiedEvent.round_number > 0
-        ).order_by(UnifiedEvent.round_number).all()
+        # Add rank and normalized score (for reference) in one pass; after sorting
+        # the maximum final score is the first entry's
+        max_score = leaderboard[0]["final_score"] if leaderboard else 0
+        scale = 100 / max_score if max_score > 0 else 0.0
+        for i, team in enumerate(leaderboard, 1):
+            team["rank"] = i
+            team["normalized_score"] = round(team["final_score"] * scale, 2)
         
         # Create header with round columns
         header = [
@@ -231,19 +248,36 @@ class ExportService:
         ]
         
         # Add round columns
-        for round_data in all_rounds:
-            header.append(f"Round {round_data.round_number} Score")
+        for _, round_number in all_rounds:
+            header.append(f"Round {round_number} Score")
         
-        writer.writerow(header)
+        # Column order only needs the round ids
+        round_ids = [round_id for round_id, _ in all_rounds]
         
-        # Get team scores for all teams
-        team_scores_dict = {}
-        for team in leaderboard:
-            team_scores = self.db.query(TeamScore).filter(
-                TeamScore.team_id == team["team_id"]
-            ).all()
-            team_scores_dict[team["team_id"]] = {score.round_id: score.score for score in team_scores}
+        # Get team scores for the round columns
+        team_scores_dict = defaultdict(dict)
+        if leaderboard:
+            for team_id, round_id, score in self.db.query(
+                TeamScore.team_id, TeamScore.round_id, TeamScore.score
+            ).filter(
+                TeamScore.team_id.in_([team["team_id"] for team in leaderboard]),
+                TeamScore.round_id.in_(round_ids)
+            ):
+                team_scores_dict[team_id][round_id] = score
+        
+        # Commit any current_round updates in one batched UPDATE
+        if current_round_updates:
+            self.db.bulk_update_mappings(Team, current_round_updates)
+        self.db.commit()
         
+        return StreamingResponse(
+            csv_chunks(header, self._leaderboard_rows(leaderboard, round_ids, team_scores_dict)),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=leaderboard.csv"}
+        )
+
+    def _leaderboard_rows(self, leaderboard: list, round_ids: list, team_scores_dict: dict) -> Iterator[list]:
+        """Yield the leaderboard export rows"""
         # Write data
         for team in leaderboard:
             row = [
@@ -259,31 +293,44 @@ class ExportService:
             
             # Add round scores
             team_scores = team_scores_dict.get(team["team_id"], {})
-            for round_data in all_rounds:
-                score = team_scores.get(round_data.id, 0.0)
+            for round_id in round_ids:
+                score = team_scores.get(round_id, 0.0)
                 row.append(round(score, 2))
             
-            writer.writerow(row)
-        
-        # Commit any current_round updates
-        self.db.commit()
-        
-        # Get CSV content
-        csv_content = output.getvalue()
-        output.close()
-        
-        # Return CSV file
-        return Response(
-            content=csv_content,
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=leaderboard.csv"}
-        )
+            yield row
 
-    def export_rolling_results(self, is_frozen: bool = None, is_evaluated: bool = None) -> Response:
+    def export_rolling_results(self, is_frozen: bool = None, is_evaluated: bool = None) -> StreamingResponse:
         """Export rolling event results to CSV"""
         
-        # Build query
-        query = self.db.query(RollingEventResult)
+        # Build query (event name comes from the event's round 0 row in the same query)
+        # Only the exported columns are selected; no ORM objects are built per result
+        query = self.db.query(
+            RollingEventResult.event_id,
+            UnifiedEvent.name,
+            RollingEventResult.club,
+            RollingEventResult.winner_name,
+            RollingEventResult.winner_register_number,
+            RollingEventResult.winner_email,
+            RollingEventResult.winner_phone,
+            RollingEventResult.winner_department_id,
+            RollingEventResult.winner_year_id,
+            RollingEventResult.runner_up_name,
+            RollingEventResult.runner_up_register_number,
+            RollingEventResult.runner_up_email,
+            RollingEventResult.runner_up_phone,
+            RollingEventResult.runner_up_department_id,
+            RollingEventResult.runner_up_year_id,
+            RollingEventResult.is_frozen,
+            RollingEventResult.is_evaluated,
+            RollingEventResult.created_at,
+            RollingEventResult.updated_at
+        ).outerjoin(
+            UnifiedEvent,
+            and_(
+                UnifiedEvent.event_id == RollingEventResult.event_id,
+                UnifiedEvent.round_number == 0
+            )
+        )
         
         # Apply filters
         if is_frozen is not None:
@@ -291,57 +338,8 @@ class ExportService:
         if is_evaluated is not None:
             query = query.filter(RollingEventResult.is_evaluated == is_evaluated)
         
-        # Get results and sort by event name
-        results = query.order_by(RollingEventResult.event_id).all()
-        
-        # Create CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        header = [
-            "Event ID", "Event Name", "Club", "Winner Name", "Winner Register Number",
-            "Winner Email", "Winner Phone", "Winner Department", "Winner Year",
-            "Runner-up Name", "Runner-up Register Number", "Runner-up Email", 
-            "Runner-up Phone", "Runner-up Department", "Runner-up Year",
-            "Is Frozen", "Is Evaluated", "Created At", "Updated At"
-        ]
-        writer.writerow(header)
-        
-        # Write data
-        for result in results:
-            # Get event name
-            event = self.db.query(UnifiedEvent).filter(
-                UnifiedEvent.event_id == result.event_id,
-                UnifiedEvent.round_number == 0
-            ).first()
-            
-            row = [
-                result.event_id,
-                event.name if event else result.event_id,
-                result.club,
-                result.winner_name,
-                result.winner_register_number,
-                result.winner_email,
-                result.winner_phone,
-                result.winner_department,
-                result.winner_year,
-                result.runner_up_name,
-                result.runner_up_register_number,
-                result.runner_up_email,
-                result.runner_up_phone,
-                result.runner_up_department,
-                result.runner_up_year,
-                result.is_frozen,
-                result.is_evaluated,
-                result.created_at,
-                result.updated_at
-            ]
-            writer.writerow(row)
-        
-        # Get CSV content
-        csv_content = output.getvalue()
-        output.close()
+        # Sort by event; rows are fetched in batches while the response streams
+        query = query.order_by(RollingEventResult.event_id)
         
         # Determine filename based on filters
         filename = "rolling_events_results.csv"
@@ -350,9 +348,38 @@ class ExportService:
         elif is_evaluated is not None and is_evaluated:
             filename = "evaluated_rolling_events_results.csv"
         
-        # Return CSV file
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            csv_chunks(ROLLING_RESULTS_HEADER, self._rolling_results_rows(query)),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
+
+    def _rolling_results_rows(self, query) -> Iterator[list]:
+        """Yield the rolling results export rows, fetching results in batches of 1000"""
+        # Write data
+        for (event_id, event_name, club, winner_name, winner_register_number, winner_email,
+             winner_phone, winner_department_id, winner_year_id, runner_up_name,
+             runner_up_register_number, runner_up_email, runner_up_phone, runner_up_department_id,
+             runner_up_year_id, is_frozen, is_evaluated, created_at, updated_at) in query.yield_per(1000):
+            row = [
+                event_id,
+                event_name or event_id,
+                club,
+                winner_name,
+                winner_register_number,
+                winner_email,
+                winner_phone,
+                DEPARTMENTS_BY_ID.get(winner_department_id),
+                YEARS_BY_ID.get(winner_year_id),
+                runner_up_name,
+                runner_up_register_number,
+                runner_up_email,
+                runner_up_phone,
+                DEPARTMENTS_BY_ID.get(runner_up_department_id),
+                YEARS_BY_ID.get(runner_up_year_id),
+                is_frozen,
+                is_evaluated,
+                created_at,
+                updated_at
+            ]
+            yield row
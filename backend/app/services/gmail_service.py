@@ -1,9 +1,10 @@
 import os
 import base64
+import threading
+import uuid
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from functools import lru_cache
 from typing import List, Optional
 import logging
 
@@ -18,20 +19,125 @@ SCOPES = ['https://www.googleapis.com/auth/gmail.send']
 
 logger = logging.getLogger(__name__)
 
+def _build_message_bytes(
+    to_emails: List[str],
+    subject: str,
+    body: str,
+    attachment_data: bytes,
+    attachment_filename: str
+) -> bytes:
+    """
+    Serialize a multipart email with one attachment.
+
+    The email package only builds the headers and HTML part; the attachment part is
+    spliced in with its payload base64-encoded once, instead of having MIMEBase hold
+    an encoded copy that as_bytes() then walks and copies again.
+    """
+    boundary = uuid.uuid4().hex
+    message = MIMEMultipart(boundary=boundary)
+    message['to'] = ', '.join(to_emails)
+    message['subject'] = subject
+    message.attach(MIMEText(body, 'html'))
+
+    # Drop the closing delimiter so the attachment part can be appended before it
+    closing = f"--{boundary}--\n".encode()
+    head = message.as_bytes()
+    if head.endswith(closing):
+        head = head[:-len(closing)]
+
+    return b"".join((
+        head,
+        f"--{boundary}\n"
+        "Content-Type: application/octet-stream\n"
+        "MIME-Version: 1.0\n"
+        "Content-Transfer-Encoding: base64\n"
+        f"Content-Disposition: attachment; filename= {attachment_filename}\n\n".encode(),
+        base64.encodebytes(attachment_data),
+        closing
+    ))
+
+@lru_cache(maxsize=8)
+def _leaderboard_email_content(event_name: str):
+    """Subject and HTML body for the leaderboard email; identical for every send of an event"""
+    subject = f"{event_name} - Leaderboard Export"
+    body = f"""
+        <html>
+        <body>
+            <h2>{event_name} Leaderboard Export</h2>
+            <p>Please find the attached leaderboard CSV file with current team rankings and scores.</p>
+            <p>This export includes:</p>
+            <ul>
+                <li>Team rankings and final scores</li>
+                <li>Weighted averages across all evaluated rounds</li>
+                <li>Team status and round completion information</li>
+            </ul>
+            <p>Best regards,<br>
+            Crestora'25 Team</p>
+        </body>
+        </html>
+        """
+    return subject, body
+
+
 class GmailService:
     def __init__(self):
         self.service = None
         self.credentials = None
         self._authenticated = False
         self._auth_error = None
+        # Authentication (and the discovery build) is deferred to first use so importing
+        # the app does no network I/O; the built service is then reused for every send.
+        # It blocks, so async routes make the first is_authenticated() call in a threadpool
+        self._auth_attempted = False
+        self._lock = threading.Lock()
+    
+    def _ensure_authenticated(self):
+        """Authenticate once, on first use"""
+        if self._auth_attempted:
+            return
+        with self._lock:
+            if self._auth_attempted:
+                return
+            try:
+                self._authenticate()
+            except Exception as e:
+                logger.error(f"Failed to initialize Gmail service: {str(e)}")
+                self._auth_error = str(e)
+            self._auth_attempted = True
+    
+    def _refresh_service(self) -> bool:
+        """Refresh expired credentials and rebuild the service; False if that is not possible"""
+        with self._lock:
+            if not self.credentials or not self.credentials.refresh_token:
+                return False
+            try:
+                self.credentials.refresh(Request())
+                self.service = build('gmail', 'v1', credentials=self.credentials)
+                logger.info("Gmail credentials refreshed")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to refresh Gmail credentials: {str(e)}")
+                return False
+    
+    def _send_raw(self, raw_message: str) -> dict:
+        """Send an encoded message, refreshing the credentials once if they were rejected"""
         try:
-            self._authenticate()
-        except Exception as e:
-            logger.error(f"Failed to initialize Gmail service: {str(e)}")
-            self._auth_error = str(e)
+            return self.service.users().messages().send(userId='me', body={'raw': raw_message}).execute()
+        except HttpError as error:
+            if error.resp.status != 401 or not self._refresh_service():
+                raise
+            return self.service.users().messages().send(userId='me', body={'raw': raw_message}).execute()
+    
+    def authenticate_interactive(self) -> bool:
+        """Authenticate, running the browser consent flow if there is no usable token (setup scripts only)"""
+        with self._lock:
+            self._auth_error = None
+            self._authenticate(interactive=True)
+            self._auth_attempted = True
+        return self.is_authenticated()
     
-    def _authenticate(self):
-        """Authenticate with Gmail API"""
+    def _authenticate(self, interactive: bool = False):
+        """Authenticate with Gmail API; without interactive, a missing or unusable token is only recorded as an error"""
         try:
             # Check if credentials file exists
             creds_file = os.getenv('GMAIL_CREDENTIALS_FILE', 'credentials.json')
@@ -49,9 +155,14 @@ class GmailService:
             if not self.credentials or not self.credentials.valid:
                 if self.credentials and self.credentials.expired and self.credentials.refresh_token:
                     self.credentials.refresh(Request())
-                else:
+                elif interactive:
                     flow = InstalledAppFlow.from_client_secrets_file(creds_file, SCOPES)
                     self.credentials = flow.run_local_server(port=0)
+                else:
+                    # The consent flow waits for a browser, which must never happen inside a request
+                    self._auth_error = f"No valid Gmail token at {token_file}; run test_gmail_auth.py to authorize"
+                    logger.warning(self._auth_error)
+                    return
                 
                 # Save credentials for next run
                 with open(token_file, 'w') as token:
@@ -70,6 +181,7 @@ class GmailService:
     
     def is_authenticated(self) -> bool:
         """Check if Gmail service is authenticated"""
+        self._ensure_authenticated()
         return self._authenticated and self.service is not None
     
     def get_auth_error(self) -> str:
@@ -106,32 +218,13 @@ class GmailService:
             return False
         
         try:
-            # Create message
-            message = MIMEMultipart()
-            message['to'] = ', '.join(to_emails)
-            message['subject'] = subject
-            
-            # Add body
-            message.attach(MIMEText(body, 'html'))
-            
-            # Add attachment
-            attachment = MIMEBase('application', 'octet-stream')
-            attachment.set_payload(attachment_data)
-            encoders.encode_base64(attachment)
-            attachment.add_header(
-                'Content-Disposition',
-                f'attachment; filename= {attachment_filename}'
-            )
-            message.attach(attachment)
-            
             # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+            raw_message = base64.urlsafe_b64encode(
+                _build_message_bytes(to_emails, subject, body, attachment_data, attachment_filename)
+            ).decode('utf-8')
             
             # Send message
-            send_message = self.service.users().messages().send(
-                userId='me',
-                body={'raw': raw_message}
-            ).execute()
+            send_message = self._send_raw(raw_message)
             
             logger.info(f"Email sent successfully. Message ID: {send_message['id']}")
             return True
@@ -171,24 +264,7 @@ class GmailService:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
-        subject = f"{event_name} - Leaderboard Export"
-        
-        body = f"""
-        <html>
-        <body>
-            <h2>{event_name} Leaderboard Export</h2>
-            <p>Please find the attached leaderboard CSV file with current team rankings and scores.</p>
-            <p>This export includes:</p>
-            <ul>
-                <li>Team rankings and final scores</li>
-                <li>Weighted averages across all evaluated rounds</li>
-                <li>Team status and round completion information</li>
-            </ul>
-            <p>Best regards,<br>
-            Crestora'25 Team</p>
-        </body>
-        </html>
-        """
+        subject, body = _leaderboard_email_content(event_name)
         
         return self.send_email_with_attachment(
             to_emails=to_emails,
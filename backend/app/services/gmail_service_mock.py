@@ -27,9 +27,9 @@ class MockGmailService:
         from_email: str = None
     ) -> bool:
         """Mock email sending - simulates success"""
-        logger.info(f"Mock: Sending email to {to_emails}")
-        logger.info(f"Mock: Subject: {subject}")
-        logger.info(f"Mock: Attachment: {attachment_filename} ({len(attachment_data)} bytes)")
+        logger.info("Mock: Sending email to %s", to_emails)
+        logger.info("Mock: Subject: %s", subject)
+        logger.info("Mock: Attachment: %s (%d bytes)", attachment_filename, len(attachment_data))
         return True
     
     def send_leaderboard_csv(
@@ -39,7 +39,7 @@ class MockGmailService:
         event_name: str = "Crestora'25"
     ) -> bool:
         """Mock leaderboard CSV sending"""
-        logger.info(f"Mock: Sending leaderboard CSV to {to_emails} for {event_name}")
+        logger.info("Mock: Sending leaderboard CSV to %s for %s", to_emails, event_name)
         return True
 
 # Mock instance for testing
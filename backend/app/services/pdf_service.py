@@ -1,20 +1,205 @@
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from cachetools import LRUCache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
+import asyncio
+import hashlib
 import io
+import logging
+import multiprocessing
+import os
+import threading
 import base64
 from typing import List, Dict, Any
 
+logger = logging.getLogger(__name__)
+
+# Detailed leaderboard (no template file; compiled once per PDFService)
+DETAILED_LEADERBOARD_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{{ event_name }} - Detailed Leaderboard</title>
+    <style>
+        @page {
+            size: A4 landscape;
+            margin: 15mm;
+        }
+        
+        body {
+            font-family: Arial, sans-serif;
+            font-size: 10px;
+        }
+        
+        h1 {
+            text-align: center;
+            font-size: 18px;
+            margin-bottom: 20px;
+        }
+        
+        table {
+            width: 100%;
+            /* Column widths come from the colgroup, so rows need not be measured */
+            table-layout: fixed;
+            border-collapse: collapse;
+            margin-top: 10px;
+        }
+        
+        th {
+            background-color: #f0f0f0;
+            border: 1px solid #000;
+            padding: 8px;
+            text-align: center;
+            font-weight: bold;
+        }
+        
+        td {
+            border: 1px solid #000;
+            padding: 6px;
+            text-align: center;
+        }
+        
+        .rank-1 { background-color: #ffd700; }
+        .rank-2 { background-color: #c0c0c0; }
+        .rank-3 { background-color: #cd7f32; }
+    </style>
+</head>
+<body>
+    <h1>{{ event_name }} - Detailed Leaderboard</h1>
+    <table>
+        <colgroup>
+            <col style="width: 6%">
+            <col style="width: 12%">
+            <col style="width: 28%">
+            <col style="width: 22%">
+            <col style="width: 11%">
+            <col style="width: 11%">
+            <col style="width: 10%">
+        </colgroup>
+        <thead>
+            <tr>
+                <th>Rank</th>
+                <th>Team Code</th>
+                <th>Team Name</th>
+                <th>Leader Name</th>
+                <th>Final Score</th>
+                <th>Percentile</th>
+                <th>Status</th>
+            </tr>
+        </thead>
+        <tbody>
+            {% for team in teams %}
+            <tr class="{% if team.rank <= 3 %}rank-{{ team.rank }}{% endif %}">
+                <td>{{ team.rank }}</td>
+                <td><strong>{{ team.team_id }}</strong></td>
+                <td>{{ team.team_name }}</td>
+                <td>{{ team.leader_name }}</td>
+                <td>{{ '%.2f' | format(team.final_score) }}</td>
+                <td>{{ '%.2f' | format(team.normalized_score or 0) }}%</td>
+                <td>{{ team.status.value or team.status }}</td>
+            </tr>
+            {% endfor %}
+        </tbody>
+    </table>
+</body>
+</html>
+"""
+
+# Logo images; __file__ is in backend/app/services/, so go up 2 levels to backend/, then into public/
+PUBLIC_DIR = Path(__file__).parent.parent.parent / 'public'
+
+@lru_cache(maxsize=None)
+def _logo_data_url(path: Path) -> str:
+    """PNG at path as a base64 data URL ('' if missing); the logos never change at runtime"""
+    if not path.exists():
+        return ''
+    with open(path, 'rb') as f:
+        return f"data:image/png;base64,{base64.b64encode(f.read()).decode('utf-8')}"
+
+# WeasyPrint rendering is CPU-bound and holds the GIL, so PDFs are rendered in worker
+# processes; concurrent exports then run in parallel instead of queueing on the event loop.
+# The pool is per API worker, so keep it small; it is started on the first export with
+# "spawn" (forking a process that already runs threads is unsafe) and rebuilt if a worker dies
+PDF_WORKERS = int(os.getenv('PDF_WORKERS', '2'))
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pdf_pool
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next render starts a fresh one"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False)
+
+# Recently generated PDFs keyed on a hash of their HTML; the HTML carries the event name,
+# round number and every team row, so a re-download of unchanged data skips WeasyPrint
+# and any change to the data simply misses
+PDF_CACHE_SIZE = int(os.getenv('PDF_CACHE_SIZE', '32'))
+_pdf_cache = LRUCache(maxsize=PDF_CACHE_SIZE)
+
+# Per worker process: font lookup and decoded images (the logos) are shared by every render
+_font_config = None
+_image_cache = {}
+
+def _write_pdf(html_content: str) -> bytes:
+    """Render HTML to PDF bytes with WeasyPrint (runs inside a PDF pool worker)"""
+    global _font_config
+    if _font_config is None:
+        _font_config = FontConfiguration()
+    return HTML(string=html_content).write_pdf(font_config=_font_config, cache=_image_cache)
+
 class PDFService:
     def __init__(self):
-        # Set up Jinja2 environment
+        # Set up Jinja2 environment; templates never change at runtime, so skip the
+        # per-render mtime check and compile each one once here
         template_dir = Path(__file__).parent.parent / 'templates'
         self.env = Environment(
             loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(['html', 'xml'])
+            autoescape=select_autoescape(['html', 'xml']),
+            auto_reload=False
         )
+        self._official_template = self.env.get_template('leaderboard_official.html')
+        self._shortlisted_template = self.env.get_template('leaderboard_shortlisted.html')
+        self._detailed_template = self.env.from_string(DETAILED_LEADERBOARD_TEMPLATE)
+    
+    async def _render_pdf(self, html_content: str) -> bytes:
+        """Render HTML to PDF bytes in the worker pool without blocking the event loop"""
+        key = hashlib.sha256(html_content.encode('utf-8')).digest()
+        pdf_bytes = _pdf_cache.get(key)
+        if pdf_bytes is None:
+            pool = _get_pdf_pool()
+            try:
+                pdf_bytes = await asyncio.get_running_loop().run_in_executor(pool, _write_pdf, html_content)
+            except BrokenProcessPool:
+                # A worker died (and took the pool with it); retry once on a fresh pool
+                logger.warning("PDF worker pool broke, restarting it")
+                _discard_pdf_pool(pool)
+                pool = _get_pdf_pool()
+                try:
+                    pdf_bytes = await asyncio.get_running_loop().run_in_executor(pool, _write_pdf, html_content)
+                except BrokenProcessPool:
+                    _discard_pdf_pool(pool)
+                    raise
+            _pdf_cache[key] = pdf_bytes
+        return pdf_bytes
     
-    def generate_official_leaderboard_pdf(
+    async def generate_official_leaderboard_pdf(
         self,
         teams: List[Dict[str, Any]],
         event_name: str = "CRESTORA'25",
@@ -31,57 +216,22 @@ class PDFService:
         Returns:
             PDF file as bytes
         """
-        # Load the template
-        template = self.env.get_template('leaderboard_official.html')
-        
         # Render the template with data
-        html_content = template.render(
+        html_content = self._official_template.render(
             teams=teams,
             event_name=event_name,
-            round_number=round_number
+            round_number=round_number,
+            left_logo=_logo_data_url(PUBLIC_DIR / 'left.png'),
+            right_logo=_logo_data_url(PUBLIC_DIR / 'right.png'),
+            water_logo=_logo_data_url(PUBLIC_DIR / 'water.png')
         )
         
-        # Set base URL to the public directory for image resolution
-        # __file__ is in backend/app/services/, so go up 2 levels to backend/, then into public/
-        public_dir = Path(__file__).parent.parent.parent / 'public'
-        
-        # Convert images to base64 for embedding
-        left_logo_path = public_dir / 'left.png'
-        right_logo_path = public_dir / 'right.png'
-        water_logo_path = public_dir / 'water.png'
-        
-        if left_logo_path.exists():
-            with open(left_logo_path, 'rb') as f:
-                left_logo_b64 = base64.b64encode(f.read()).decode('utf-8')
-                left_logo_data = f'data:image/png;base64,{left_logo_b64}'
-        else:
-            left_logo_data = ''
-        
-        if right_logo_path.exists():
-            with open(right_logo_path, 'rb') as f:
-                right_logo_b64 = base64.b64encode(f.read()).decode('utf-8')
-                right_logo_data = f'data:image/png;base64,{right_logo_b64}'
-        else:
-            right_logo_data = ''
-        
-        if water_logo_path.exists():
-            with open(water_logo_path, 'rb') as f:
-                water_logo_b64 = base64.b64encode(f.read()).decode('utf-8')
-                water_logo_data = f'data:image/png;base64,{water_logo_b64}'
-        else:
-            water_logo_data = ''
-        
-        # Replace relative image paths with base64 data URLs
-        html_content = html_content.replace('src="public/left.png"', f'src="{left_logo_data}"')
-        html_content = html_content.replace('src="public/right.png"', f'src="{right_logo_data}"')
-        html_content = html_content.replace('src="public/water.png"', f'src="{water_logo_data}"')
-        
         # Generate PDF from HTML
-        pdf_bytes = HTML(string=html_content).write_pdf()
+        pdf_bytes = await self._render_pdf(html_content)
         
         return pdf_bytes
     
-    def generate_detailed_leaderboard_pdf(
+    async def generate_detailed_leaderboard_pdf(
         self,
         teams: List[Dict[str, Any]],
         event_name: str = "CRESTORA'25",
@@ -98,106 +248,17 @@ class PDFService:
         Returns:
             PDF file as bytes
         """
-        # Create a detailed HTML template inline for now
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>{event_name} - Detailed Leaderboard</title>
-            <style>
-                @page {{
-                    size: A4 landscape;
-                    margin: 15mm;
-                }}
-                
-                body {{
-                    font-family: Arial, sans-serif;
-                    font-size: 10px;
-                }}
-                
-                h1 {{
-                    text-align: center;
-                    font-size: 18px;
-                    margin-bottom: 20px;
-                }}
-                
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-top: 10px;
-                }}
-                
-                th {{
-                    background-color: #f0f0f0;
-                    border: 1px solid #000;
-                    padding: 8px;
-                    text-align: center;
-                    font-weight: bold;
-                }}
-                
-                td {{
-                    border: 1px solid #000;
-                    padding: 6px;
-                    text-align: center;
-                }}
-                
-                .rank-1 {{ background-color: #ffd700; }}
-                .rank-2 {{ background-color: #c0c0c0; }}
-                .rank-3 {{ background-color: #cd7f32; }}
-            </style>
-        </head>
-        <body>
-            <h1>{event_name} - Detailed Leaderboard</h1>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Rank</th>
-                        <th>Team Code</th>
-                        <th>Team Name</th>
-                        <th>Leader Name</th>
-                        <th>Final Score</th>
-                        <th>Percentile</th>
-                        <th>Status</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """
-        
-        for team in teams:
-            rank_class = ""
-            if team['rank'] == 1:
-                rank_class = "rank-1"
-            elif team['rank'] == 2:
-                rank_class = "rank-2"
-            elif team['rank'] == 3:
-                rank_class = "rank-3"
-            
-            html_content += f"""
-                    <tr class="{rank_class}">
-                        <td>{team['rank']}</td>
-                        <td><strong>{team['team_id']}</strong></td>
-                        <td>{team['team_name']}</td>
-                        <td>{team['leader_name']}</td>
-                        <td>{team['final_score']:.2f}</td>
-                    <td>{team.get('normalized_score', 0):.2f}%</td>
-                    <td>{team['status']}</td>
-                    </tr>
-            """
-        
-        html_content += """
-                </tbody>
-            </table>
-        </body>
-        </html>
-        """
+        html_content = self._detailed_template.render(
+            teams=teams,
+            event_name=event_name
+        )
         
         # Generate PDF from HTML
-        pdf_bytes = HTML(string=html_content).write_pdf()
+        pdf_bytes = await self._render_pdf(html_content)
         
         return pdf_bytes
     
-    def generate_shortlisted_leaderboard_pdf(
+    async def generate_shortlisted_leaderboard_pdf(
         self,
         teams: List[Dict[str, Any]],
         event_name: str = "CRESTORA'25",
@@ -214,59 +275,22 @@ class PDFService:
         Returns:
             PDF file as bytes
         """
-        # Sort teams alphabetically by team_name
+        # Sort teams alphabetically by team_name (Si.No comes from loop.index in the template,
+        # so the caller's dicts are left untouched)
         sorted_teams = sorted(teams, key=lambda x: (x.get("team_name") or "").upper())
         
-        # Assign serial numbers (Si.No) starting from 1
-        for index, team in enumerate(sorted_teams, start=1):
-            team["si_no"] = index
-        
-        # Load the template
-        template = self.env.get_template('leaderboard_shortlisted.html')
-        
         # Render the template with data
-        html_content = template.render(
+        html_content = self._shortlisted_template.render(
             teams=sorted_teams,
             event_name=event_name,
-            round_number=round_number
+            round_number=round_number,
+            left_logo=_logo_data_url(PUBLIC_DIR / 'left.png'),
+            right_logo=_logo_data_url(PUBLIC_DIR / 'right.png'),
+            water_logo=_logo_data_url(PUBLIC_DIR / 'water.png')
         )
         
-        # Set base URL to the public directory for image resolution
-        public_dir = Path(__file__).parent.parent.parent / 'public'
-        
-        # Convert images to base64 for embedding
-        left_logo_path = public_dir / 'left.png'
-        right_logo_path = public_dir / 'right.png'
-        water_logo_path = public_dir / 'water.png'
-        
-        if left_logo_path.exists():
-            with open(left_logo_path, 'rb') as f:
-                left_logo_b64 = base64.b64encode(f.read()).decode('utf-8')
-                left_logo_data = f'data:image/png;base64,{left_logo_b64}'
-        else:
-            left_logo_data = ''
-        
-        if right_logo_path.exists():
-            with open(right_logo_path, 'rb') as f:
-                right_logo_b64 = base64.b64encode(f.read()).decode('utf-8')
-                right_logo_data = f'data:image/png;base64,{right_logo_b64}'
-        else:
-            right_logo_data = ''
-        
-        if water_logo_path.exists():
-            with open(water_logo_path, 'rb') as f:
-                water_logo_b64 = base64.b64encode(f.read()).decode('utf-8')
-                water_logo_data = f'data:image/png;base64,{water_logo_b64}'
-        else:
-            water_logo_data = ''
-        
-        # Replace relative image paths with base64 data URLs
-        html_content = html_content.replace('src="public/left.png"', f'src="{left_logo_data}"')
-        html_content = html_content.replace('src="public/right.png"', f'src="{right_logo_data}"')
-        html_content = html_content.replace('src="public/water.png"', f'src="{water_logo_data}"')
-        
         # Generate PDF from HTML
-        pdf_bytes = HTML(string=html_content).write_pdf()
+        pdf_bytes = await self._render_pdf(html_content)
         
         return pdf_bytes
 
@@ -1,18 +1,29 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, case, func, insert, literal, select
 from typing import List, Dict, Any, Optional
 from app.models.rounds import UnifiedEvent
 from app.models.team import Team, TeamStatus
 from app.models.team_score import TeamScore
 from app.models.round_weight import RoundWeight
+from app.queries import team_by_team_id, scores_for_round
 from app.schemas.team_score import TeamScoreCreate, TeamScoreUpdate
 from app.schemas.round_weight import RoundWeightCreate
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 class RoundService:
     def __init__(self, db: Session):
         self.db = db
 
+    def _get_round(self, round_id: int) -> UnifiedEvent:
+        """Round by primary key; repeat lookups in the same session come from the identity map"""
+        round_obj = self.db.get(UnifiedEvent, round_id)
+        if not round_obj:
+            raise ValueError("Round not found")
+        return round_obj
+
     def create_round(self, round_data: dict, user_role: str) -> UnifiedEvent:
         """Create a new round (PDA only) and initialize team scores"""
         if user_role != "admin":  # PDA role is admin
@@ -23,25 +34,26 @@ class RoundService:
         self.db.add(db_round)
         self.db.flush()  # Get the ID
         
-        # Initialize team scores based on round type
+        # Initialize team scores based on round type with one INSERT ... SELECT (team ids never leave the database)
         if db_round.is_wildcard:
             # For wildcard rounds, only initialize scores for eliminated teams
-            teams_to_initialize = self.db.query(Team).filter(Team.status == TeamStatus.ELIMINATED).all()
+            initial_status = TeamStatus.ELIMINATED
         else:
             # For regular rounds, initialize scores for active teams
-            teams_to_initialize = self.db.query(Team).filter(Team.status == TeamStatus.ACTIVE).all()
-        
-        for team in teams_to_initialize:
-            team_score = TeamScore(
-                team_id=team.team_id,
-                round_id=db_round.id,
-                event_id=db_round.event_id,
-                score=0.0,
-                raw_total_score=0.0,
-                is_normalized=True,  # Default to True, will be set to False only if criteria are malformed
-                is_present=False if db_round.is_wildcard else True  # Default to absent for wildcard rounds
-            )
-            self.db.add(team_score)
+            initial_status = TeamStatus.ACTIVE
+        
+        self.db.execute(insert(TeamScore).from_select(
+            ["team_id", "round_id", "event_id", "score", "raw_total_score", "is_normalized", "is_present"],
+            select(
+                Team.team_id,
+                literal(db_round.id),
+                literal(db_round.event_id),
+                literal(0.0),
+                literal(0.0),
+                literal(True),  # is_normalized: set to False only if criteria are malformed
+                literal(not db_round.is_wildcard)  # is_present: default to absent for wildcard rounds
+            ).where(Team.status == initial_status)
+        ))
         
         # Set default weight to 100%
         round_weight = RoundWeight(
@@ -56,7 +68,7 @@ class RoundService:
 
     def check_round_is_wildcard(self, round_id: int) -> dict:
         """Check if a round is a wildcard round"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
+        round_obj = self.db.get(UnifiedEvent, round_id)
         if not round_obj:
             raise ValueError(f"Round with ID {round_id} not found")
         
@@ -65,9 +77,7 @@ class RoundService:
 
     def update_criteria(self, round_id: int, criteria: List[Dict[str, Any]], user_role: str, user_club: str = None) -> UnifiedEvent:
         """Update evaluation criteria for a round"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
         # Check permissions
         if user_role == "clubs" and round_obj.club != user_club:
@@ -85,9 +95,8 @@ class RoundService:
                      user_role: str, user_club: str = None, is_present: bool = True, 
                      eliminate_absentees: bool = True) -> TeamScore:
         """Evaluate a team for a specific round"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        # Identity-map lookup: no query when the round is already loaded in this session
+        round_obj = self._get_round(round_id)
         
         # Check permissions
         if user_role == "clubs" and round_obj.club != user_club:
@@ -97,30 +106,26 @@ class RoundService:
             raise ValueError("Cannot evaluate teams for frozen rounds")
         
         # Check if team exists and can be evaluated
-        team = self.db.query(Team).filter(Team.team_id == team_id).first()
+        team = self.db.execute(team_by_team_id(team_id)).scalars().first()
         if not team:
             raise ValueError("Team not found")
         
+        # Existing score row for this round (also decides wildcard eligibility below)
+        team_score = self.db.query(TeamScore).filter(
+            and_(TeamScore.round_id == round_id, TeamScore.team_id == team_id)
+        ).first()
+        
         # For wildcard rounds, allow eliminated teams OR teams that have TeamScore records for this round
         # For regular rounds, only allow active teams
         if round_obj.is_wildcard:
-            # Check if team has a TeamScore record for this round (includes originally eliminated and reactivated teams)
-            has_team_score = self.db.query(TeamScore).filter(
-                TeamScore.team_id == team_id,
-                TeamScore.round_id == round_id
-            ).first()
-            
-            if team.status != TeamStatus.ELIMINATED and not has_team_score:
+            # A TeamScore record for this round covers originally eliminated and reactivated teams
+            if team.status != TeamStatus.ELIMINATED and not team_score:
                 raise ValueError("Only eliminated teams or teams with scores for this round can be evaluated in wildcard rounds")
         else:
             if team.status != TeamStatus.ACTIVE:
                 raise ValueError("Only active teams can be evaluated in regular rounds")
         
-        # Get or create team score
-        team_score = self.db.query(TeamScore).filter(
-            and_(TeamScore.round_id == round_id, TeamScore.team_id == team_id)
-        ).first()
-        
+        # Create the team score if there is none yet
         if not team_score:
             team_score = TeamScore(
                 team_id=team_id,
@@ -147,29 +152,30 @@ class RoundService:
             # For regular rounds, handle elimination based on setting
             if not round_obj.is_wildcard and eliminate_absentees:
                 team.status = TeamStatus.ELIMINATED
-            
-            self.db.commit()
         else:
             # Calculate raw total score only if team is present
             raw_total = sum(criteria_scores.values())
             team_score.raw_total_score = raw_total
             team_score.criteria_scores = criteria_scores
             
-            # Normalize to 100 if criteria are defined
-            if round_obj.criteria:
-                max_possible = sum(criterion.get('max_points', 0) for criterion in round_obj.criteria)
+            # Normalize to 100 if criteria are defined (their total is stored on the round)
+            max_possible = round_obj.max_possible_score
+            if max_possible is not None:
                 if max_possible > 0:
                     normalized_score = (raw_total / max_possible) * 100
                     team_score.score = min(normalized_score, 100.0)  # Cap at 100
                     team_score.is_normalized = True
                 else:
-                    team_score.score = raw_total
+                    # Nothing to normalize against; the uncapped total stays in raw_total_score
+                    team_score.score = min(raw_total, 100.0)
                     team_score.is_normalized = False
             else:
                 # Default normalization to 100
                 team_score.score = min(raw_total, 100.0)
                 team_score.is_normalized = True
         
+        # Single commit for the score (and any elimination); the refresh reads back the
+        # server-set timestamps for the response
         self.db.commit()
         self.db.refresh(team_score)
         return team_score
@@ -179,9 +185,7 @@ class RoundService:
         if user_role not in ["admin", "clubs"]:
             raise ValueError("Only PDA and club members can freeze rounds")
         
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
         # Club users can only freeze their own rounds
         if user_role == "clubs" and round_obj.club != user_club:
@@ -190,28 +194,29 @@ class RoundService:
         if round_obj.is_frozen:
             raise ValueError("Round is already frozen")
         
-        # Get all team scores for this round
-        team_scores = self.db.query(TeamScore).filter(TeamScore.round_id == round_id).all()
+        # Calculate statistics in the database (max/min/avg over non-zero scores only)
+        nonzero_score = case((TeamScore.score > 0, TeamScore.score))
+        max_score, min_score, avg_score, participated_count = self.db.query(
+            func.max(nonzero_score),
+            func.min(nonzero_score),
+            func.avg(nonzero_score),
+            func.count(TeamScore.id)
+        ).filter(TeamScore.round_id == round_id).one()
         
-        if not team_scores:
+        if not participated_count:
             raise ValueError("No evaluations found for this round")
         
-        # Calculate statistics
-        scores = [ts.score for ts in team_scores if ts.score > 0]  # Non-zero scores only
-        
-        if scores:
-            max_score = max(scores)
-            min_score = min(scores)
-            avg_score = sum(scores) / len(scores)
-        else:
+        if max_score is None:
             max_score = min_score = avg_score = 0.0
+        else:
+            avg_score = float(avg_score)
         
         # Update round with statistics
         round_obj.is_frozen = True
         round_obj.max_score = max_score
         round_obj.min_score = min_score
         round_obj.avg_score = avg_score
-        round_obj.participated_count = len(team_scores)
+        round_obj.participated_count = participated_count
         
         self.db.commit()
         self.db.refresh(round_obj)
@@ -222,7 +227,7 @@ class RoundService:
             "max_score": max_score,
             "min_score": min_score,
             "avg_score": avg_score,
-            "participated_count": len(team_scores)
+            "participated_count": participated_count
         }
 
     def unfreeze_round(self, round_id: int, user_role: str, user_club: str = None) -> Dict[str, Any]:
@@ -230,9 +235,7 @@ class RoundService:
         if user_role != "admin":
             raise ValueError("Only PDA admins can unfreeze rounds")
         
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
         if not round_obj.is_frozen:
             raise ValueError("Round is not frozen")
@@ -259,38 +262,35 @@ class RoundService:
 
     def get_round_evaluations(self, round_id: int, user_role: str, user_club: str = None) -> List[TeamScore]:
         """Get all team evaluations for a round"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
         # Check permissions
         if user_role == "clubs" and round_obj.club != user_club:
             raise ValueError("You can only view evaluations for your own rounds")
         
         # Return team scores for this round (already filtered during creation)
-        return self.db.query(TeamScore).filter(TeamScore.round_id == round_id).all()
+        return self.db.execute(scores_for_round(round_id)).scalars().all()
 
     def get_round_stats(self, round_id: int) -> Dict[str, Any]:
         """Get round statistics"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
-        team_scores = self.db.query(TeamScore).filter(TeamScore.round_id == round_id).all()
+        # Only the count and the top three rows are needed, so no score rows are loaded
+        participated_count = self.db.query(func.count(TeamScore.id)).filter(
+            TeamScore.round_id == round_id
+        ).scalar()
         
-        # Get top 3 teams if round is frozen
+        # Get top 3 teams if round is frozen (sorted and truncated by the database; ties keep insertion order)
         top_3_teams = []
-        if round_obj.is_frozen and team_scores:
-            # Sort by score descending and get top 3
-            sorted_scores = sorted(team_scores, key=lambda x: x.score, reverse=True)[:3]
-            for score in sorted_scores:
-                team = self.db.query(Team).filter(Team.team_id == score.team_id).first()
-                if team:
-                    top_3_teams.append({
-                        "team_id": team.team_id,
-                        "team_name": team.team_name,
-                        "score": score.score
-                    })
+        if round_obj.is_frozen and participated_count:
+            top_3_teams = [
+                {"team_id": team_id, "team_name": team_name, "score": score}
+                for team_id, team_name, score in self.db.query(
+                    TeamScore.team_id, Team.team_name, TeamScore.score
+                ).join(Team, Team.team_id == TeamScore.team_id).filter(
+                    TeamScore.round_id == round_id
+                ).order_by(TeamScore.score.desc(), TeamScore.id).limit(3)
+            ]
         
         return {
             "round_id": round_id,
@@ -300,17 +300,15 @@ class RoundService:
             "max_score": round_obj.max_score,
             "min_score": round_obj.min_score,
             "avg_score": round_obj.avg_score,
-            "participated_count": len(team_scores),
-            "total_teams": len(team_scores),
+            "participated_count": participated_count,
+            "total_teams": participated_count,
             "shortlisted_count": len(round_obj.shortlisted_teams) if round_obj.shortlisted_teams else 0,
             "top_3_teams": top_3_teams
         }
 
     def validate_round_access(self, round_id: int, user_role: str, user_club: str = None) -> UnifiedEvent:
         """Validate if user can access a round"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
         # PDA can access all rounds
         if user_role == "admin":
@@ -328,134 +326,138 @@ class RoundService:
 
     def can_edit_round(self, round_id: int) -> bool:
         """Check if a round can be edited (not frozen)"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
+        round_obj = self.db.get(UnifiedEvent, round_id)
         if not round_obj:
             return False
         return not round_obj.is_frozen
 
     def get_round_criteria(self, round_id: int) -> List[Dict[str, Any]]:
         """Get evaluation criteria for a round"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         return round_obj.criteria or []
 
     def calculate_team_rank(self, round_id: int, team_id: str) -> int:
-        """Calculate team's rank in a round"""
-        team_scores = self.db.query(TeamScore).filter(
-            TeamScore.round_id == round_id
-        ).order_by(TeamScore.score.desc()).all()
-        
-        for i, ts in enumerate(team_scores):
-            if ts.team_id == team_id:
-                return i + 1
-        
-        return 0  # Team not found or not evaluated
+        """Calculate team's rank in a round (teams with equal scores share a rank)"""
+        own_score = aliased(TeamScore)
+        team_score = select(own_score.score).where(
+            own_score.round_id == round_id,
+            own_score.team_id == team_id
+        ).scalar_subquery()
+        
+        # One round trip; the team's score and the count of higher scores are served by the
+        # (round_id, team_id) and (round_id, score) indexes, so only one integer comes back
+        return self.db.query(
+            case((team_score.is_(None), 0), else_=func.count(TeamScore.id) + 1)  # 0: team not found or not evaluated
+        ).filter(
+            TeamScore.round_id == round_id,
+            TeamScore.score > team_score
+        ).scalar()
 
     def get_round_leaderboard(self, round_id: int, user_role: str, user_club: str = None) -> List[Dict[str, Any]]:
         """Get leaderboard for a specific round"""
         # Validate access
         self.validate_round_access(round_id, user_role, user_club)
         
-        team_scores = self.db.query(TeamScore).filter(
+        # Scores joined to their team names in one query (every score row has a team)
+        team_scores = self.db.query(
+            TeamScore.team_id,
+            Team.team_name,
+            TeamScore.score,
+            TeamScore.raw_total_score,
+            TeamScore.is_normalized,
+            TeamScore.criteria_scores
+        ).join(Team, Team.team_id == TeamScore.team_id).filter(
             TeamScore.round_id == round_id
         ).order_by(TeamScore.score.desc()).all()
         
-        leaderboard = []
-        for i, ts in enumerate(team_scores):
-            team = self.db.query(Team).filter(Team.team_id == ts.team_id).first()
-            if team:
-                leaderboard.append({
-                    "rank": i + 1,
-                    "team_id": ts.team_id,
-                    "team_name": team.team_name,
-                    "score": ts.score,
-                    "raw_total_score": ts.raw_total_score,
-                    "is_normalized": ts.is_normalized,
-                    "criteria_scores": ts.criteria_scores
-                })
-        
-        return leaderboard
+        return [
+            {
+                "rank": i,
+                "team_id": ts.team_id,
+                "team_name": ts.team_name,
+                "score": ts.score,
+                "raw_total_score": ts.raw_total_score,
+                "is_normalized": ts.is_normalized,
+                "criteria_scores": ts.criteria_scores
+            }
+            for i, ts in enumerate(team_scores, 1)
+        ]
 
     def shortlist_teams(self, round_id: int, shortlist_type: str, value: float, user_role: str) -> Dict[str, Any]:
         """Shortlist teams based on top K or score threshold (PDA only)"""
-        print(f"Shortlist request: round_id={round_id}, type={shortlist_type}, value={value}, user_role={user_role}")
+        logger.debug("Shortlist request: round_id=%s, type=%s, value=%s, user_role=%s", round_id, shortlist_type, value, user_role)
         
         if user_role != "admin":  # PDA role is admin
             raise ValueError("Only PDA can shortlist teams")
         
         # Get the round
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
-        print(f"Round found: {round_obj.name}, is_frozen: {round_obj.is_frozen}")
+        logger.debug("Round found: %s, is_frozen: %s", round_obj.name, round_obj.is_frozen)
         
         if not round_obj.is_frozen:
             raise ValueError("Round must be frozen before shortlisting")
         
-        # Get ALL active teams (not just evaluated ones)
-        all_active_teams = self.db.query(Team).filter(Team.status == TeamStatus.ACTIVE).all()
-        print(f"Found {len(all_active_teams)} active teams")
-        
-        if not all_active_teams:
-            raise ValueError("No active teams found for shortlisting")
-        
         # Pre-fetch all weights to avoid repeated queries
         weights_cache = {}
-        all_round_ids = set()
-        
-        # Get all relevant round IDs first
-        evaluated_rounds = self.db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_evaluated == True,
-            UnifiedEvent.round_number > 0
-        ).all()
         
-        frozen_rounds = self.db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_frozen == True,
-            UnifiedEvent.is_evaluated == False,
-            UnifiedEvent.round_number > 0
-        ).all()
-        
-        for round_obj in evaluated_rounds + frozen_rounds:
-            all_round_ids.add(round_obj.id)
+        # Get all relevant round IDs first (evaluated rounds + frozen rounds not yet evaluated)
+        all_round_ids = {
+            evaluated_round_id for evaluated_round_id, in self.db.query(UnifiedEvent.id).filter(
+                UnifiedEvent.round_number > 0,
+                (UnifiedEvent.is_evaluated == True) | (UnifiedEvent.is_frozen == True)
+            )
+        }
         
         # Pre-fetch all existing weights
         if all_round_ids:
-            existing_weights = self.db.query(RoundWeight).filter(
+            # Plain (round_id, weight_percentage) tuples - no ORM objects needed for a lookup dict
+            weights_cache.update(self.db.query(RoundWeight.round_id, RoundWeight.weight_percentage).filter(
                 RoundWeight.round_id.in_(all_round_ids)
-            ).all()
-            
-            for weight in existing_weights:
-                weights_cache[weight.round_id] = weight.weight_percentage
+            ))
             
-            # Create missing weights in batch
+            # Create missing weights in batch (one executemany INSERT)
             missing_round_ids = all_round_ids - set(weights_cache.keys())
-            for round_id in missing_round_ids:
-                weight = RoundWeight(
-                    round_id=round_id,
-                    weight_percentage=100.0
-                )
-                self.db.add(weight)
-                weights_cache[round_id] = 100.0
-            
-            # Commit all new weights at once
             if missing_round_ids:
+                self.db.bulk_insert_mappings(RoundWeight, [
+                    {"round_id": missing_round_id, "weight_percentage": 100.0}
+                    for missing_round_id in missing_round_ids
+                ])
+                weights_cache.update(dict.fromkeys(missing_round_ids, 100.0))
                 self.db.commit()
         
-        # Calculate overall scores for all teams using cached weights
-        all_teams_with_scores = []
-        for team in all_active_teams:
-            overall_score = self._calculate_overall_score(team.team_id, weights_cache)
-            all_teams_with_scores.append({
-                'team_id': team.team_id,
-                'team_name': team.team_name,
-                'score': overall_score or 0.0  # Default to 0 if no overall score
-            })
+        # Every team is averaged over the same rounds (missing scores count as 0), so the
+        # denominator is shared and only the weighted sums differ per team
+        total_weight = sum(weights_cache[weighted_round_id] / 100.0 for weighted_round_id in all_round_ids)
+        
+        # ALL active teams (not just evaluated ones) with their weighted score sums, ranked
+        # by the database in one query; ties keep team creation order
+        weighted_sum = func.coalesce(func.sum(TeamScore.score * RoundWeight.weight_percentage / 100.0), 0.0)
+        ranked_teams = self.db.query(Team.team_id, Team.team_name, weighted_sum).outerjoin(
+            TeamScore,
+            and_(TeamScore.team_id == Team.team_id, TeamScore.round_id.in_(all_round_ids))
+        ).outerjoin(
+            RoundWeight, RoundWeight.round_id == TeamScore.round_id
+        ).filter(
+            Team.status == TeamStatus.ACTIVE
+        ).group_by(Team.id, Team.team_id, Team.team_name).order_by(weighted_sum.desc(), Team.id).all()
+        logger.debug("Found %d active teams", len(ranked_teams))
+        
+        if not ranked_teams:
+            raise ValueError("No active teams found for shortlisting")
         
-        # Sort by overall score (descending)
-        all_teams_with_scores.sort(key=lambda x: x['score'], reverse=True)
-        print(f"All teams with overall scores: {[(t['team_id'], t['score']) for t in all_teams_with_scores]}")
+        # Overall score = weighted average (0 if there is nothing to average over)
+        all_teams_with_scores = [
+            {
+                'team_id': team_id,
+                'team_name': team_name,
+                'score': float(team_weighted_sum) / total_weight if total_weight > 0 else 0.0
+            }
+            for team_id, team_name, team_weighted_sum in ranked_teams
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            # Only format the whole cohort when debug logging is on
+            logger.debug("All teams with overall scores: %s", [(t['team_id'], t['score']) for t in all_teams_with_scores])
         
         if not all_teams_with_scores:
             raise ValueError("No teams found for shortlisting")
@@ -484,23 +486,24 @@ class RoundService:
         else:
             raise ValueError(f"Invalid shortlist_type: {shortlist_type}. Must be 'top_k' or 'threshold'")
         
-        print(f"Shortlisted: {len(shortlisted_teams)}, Eliminated: {len(eliminated_teams)}")
+        logger.debug("Shortlisted: %d, Eliminated: %d", len(shortlisted_teams), len(eliminated_teams))
         
-        # Update team statuses
-        for team_data in shortlisted_teams:
-            team = self.db.query(Team).filter(Team.team_id == team_data['team_id']).first()
-            if team:
-                team.status = TeamStatus.ACTIVE  # Keep as active (shortlisted)
-                print(f"Keeping team {team_data['team_id']} as ACTIVE")
+        # Update team statuses with one UPDATE per outcome
+        shortlisted_team_ids = [team_data['team_id'] for team_data in shortlisted_teams]
+        if shortlisted_team_ids:
+            self.db.query(Team).filter(Team.team_id.in_(shortlisted_team_ids)).update(
+                {Team.status: TeamStatus.ACTIVE},  # Keep as active (shortlisted)
+                synchronize_session=False
+            )
         
-        for team_data in eliminated_teams:
-            team = self.db.query(Team).filter(Team.team_id == team_data['team_id']).first()
-            if team:
-                team.status = TeamStatus.ELIMINATED  # Mark as eliminated
-                print(f"Eliminating team {team_data['team_id']}")
+        eliminated_team_ids = [team_data['team_id'] for team_data in eliminated_teams]
+        if eliminated_team_ids:
+            self.db.query(Team).filter(Team.team_id.in_(eliminated_team_ids)).update(
+                {Team.status: TeamStatus.ELIMINATED},  # Mark as eliminated
+                synchronize_session=False
+            )
         
         # Update round with shortlisted teams info
-        shortlisted_team_ids = [team_data['team_id'] for team_data in shortlisted_teams]
         round_obj.shortlisted_teams = shortlisted_team_ids
         round_obj.is_evaluated = True  # Set is_evaluated = 1 after successful shortlisting
         
@@ -514,88 +517,10 @@ class RoundService:
             "shortlist_value": value
         }
 
-
-    def _calculate_overall_score(self, team_id: str, weights_cache: dict = None) -> Optional[float]:
-        """Calculate overall score (weighted average) for a team based on evaluated rounds + current frozen round"""
-        # Get all evaluated rounds + current frozen round (if not yet evaluated)
-        evaluated_rounds = self.db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_evaluated == True,
-            UnifiedEvent.round_number > 0
-        ).all()
-        
-        # Also include any frozen rounds that are not yet evaluated (current round)
-        frozen_rounds = self.db.query(UnifiedEvent).filter(
-            UnifiedEvent.is_frozen == True,
-            UnifiedEvent.is_evaluated == False,
-            UnifiedEvent.round_number > 0
-        ).all()
-        
-        # Combine both sets
-        all_rounds = evaluated_rounds + frozen_rounds
-        
-        if not all_rounds:
-            return None
-        
-        # Create a set of round IDs for faster lookup
-        round_ids = {round_obj.id for round_obj in all_rounds}
-        
-        # Get team scores for all relevant rounds
-        team_scores = self.db.query(TeamScore).filter(
-            TeamScore.team_id == team_id,
-            TeamScore.round_id.in_(round_ids)
-        ).all()
-        
-        # Create a dictionary of scores for easier lookup
-        team_scores_dict = {score.round_id: score.score for score in team_scores}  # Use normalized scores for shortlisting
-        
-        # Calculate weighted average (including 0 scores for missing rounds)
-        total_weighted_score = 0.0
-        total_weight = 0.0
-        
-        for round_id in round_ids:
-            # Use cached weight if available, otherwise query database
-            if weights_cache and round_id in weights_cache:
-                weight_percentage = weights_cache[round_id]
-            else:
-                # Get weight for this round, create default if not exists
-                weight = self.db.query(RoundWeight).filter(
-                    RoundWeight.round_id == round_id
-                ).first()
-                
-                if not weight:
-                    # Create default weight of 100%
-                    weight = RoundWeight(
-                        round_id=round_id,
-                        weight_percentage=100.0
-                    )
-                    self.db.add(weight)
-                    # Don't commit here - let caller handle batch commit
-                    weight_percentage = 100.0
-                else:
-                    weight_percentage = weight.weight_percentage
-                
-                # Cache the weight for future use
-                if weights_cache is not None:
-                    weights_cache[round_id] = weight_percentage
-            
-            # Get score for this round (0 if not found)
-            round_score = team_scores_dict.get(round_id, 0.0)
-            
-            weight_value = weight_percentage / 100.0  # Convert to decimal
-            total_weighted_score += round_score * weight_value
-            total_weight += weight_value
-        
-        if total_weight == 0:
-            return None
-        
-        return total_weighted_score / total_weight
-
     def toggle_elimination_setting(self, round_id: int, eliminate_absentees: bool) -> Dict[str, Any]:
         """Toggle elimination setting and reactivate eliminated teams if needed"""
         # Validate round exists
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
         # If switching from eliminate=True to eliminate=False, reactivate eliminated teams
         if not eliminate_absentees:
@@ -606,17 +531,11 @@ class RoundService:
                 TeamScore.is_present == False
             ).all()
             
+            # The join already limits this to teams absent in this specific round
             reactivated_count = 0
             for team in eliminated_teams:
-                # Only reactivate if they were eliminated due to absence in this specific round
-                team_score = self.db.query(TeamScore).filter(
-                    TeamScore.team_id == team.team_id,
-                    TeamScore.round_id == round_id
-                ).first()
-                
-                if team_score and not team_score.is_present:
-                    team.status = TeamStatus.ACTIVE
-                    reactivated_count += 1
+                team.status = TeamStatus.ACTIVE
+                reactivated_count += 1
             
             self.db.commit()
             
@@ -634,9 +553,7 @@ class RoundService:
 
     def handle_absentees_after_freezing(self, round_id: int, eliminate_absentees: bool) -> dict:
         """Handle absent teams after a round has been frozen (PDA only)"""
-        round_obj = self.db.query(UnifiedEvent).filter(UnifiedEvent.id == round_id).first()
-        if not round_obj:
-            raise ValueError("Round not found")
+        round_obj = self._get_round(round_id)
         
         if not round_obj.is_frozen:
             raise ValueError("Round must be frozen before handling absentees")
@@ -645,39 +562,23 @@ class RoundService:
         reactivated_count = 0
         
         if eliminate_absentees:
-            # Get all team scores for this round where teams are marked as absent
-            absent_team_scores = self.db.query(TeamScore).filter(
-                and_(
-                    TeamScore.round_id == round_id,
-                    TeamScore.is_present == False
-                )
-            ).all()
-            
-            for team_score in absent_team_scores:
-                team = self.db.query(Team).filter(Team.team_id == team_score.team_id).first()
-                if not team:
-                    continue
-                
-                # Eliminate the team if not already eliminated
-                if team.status != TeamStatus.ELIMINATED:
-                    team.status = TeamStatus.ELIMINATED
-                    eliminated_count += 1
+            # Eliminate every team marked absent in this round that is not already eliminated (one UPDATE)
+            absent_team_ids = select(TeamScore.team_id).where(
+                TeamScore.round_id == round_id,
+                TeamScore.is_present == False
+            )
+            eliminated_count = self.db.query(Team).filter(
+                Team.team_id.in_(absent_team_ids),
+                Team.status != TeamStatus.ELIMINATED
+            ).update({Team.status: TeamStatus.ELIMINATED}, synchronize_session=False)
         else:
-            # When reactivating, handle both absent teams and already eliminated teams
-            # Get all teams that participated in this round (have team scores)
-            round_team_scores = self.db.query(TeamScore).filter(
-                TeamScore.round_id == round_id
-            ).all()
-            
-            for team_score in round_team_scores:
-                team = self.db.query(Team).filter(Team.team_id == team_score.team_id).first()
-                if not team:
-                    continue
-                
-                # Reactivate the team if it was eliminated (regardless of whether it was absent or not)
-                if team.status == TeamStatus.ELIMINATED:
-                    team.status = TeamStatus.ACTIVE
-                    reactivated_count += 1
+            # When reactivating, handle both absent teams and already eliminated teams:
+            # every eliminated team that participated in this round (has a team score) is reactivated
+            round_team_ids = select(TeamScore.team_id).where(TeamScore.round_id == round_id)
+            reactivated_count = self.db.query(Team).filter(
+                Team.team_id.in_(round_team_ids),
+                Team.status == TeamStatus.ELIMINATED
+            ).update({Team.status: TeamStatus.ACTIVE}, synchronize_session=False)
         
         self.db.commit()
         
@@ -38,7 +38,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.database import engine, Base
 from app.models.team import Team, TeamMember, TeamStatus
-from app.models.rounds import UnifiedEvent, EventStatus, EventType
+from app.models.team_totals import refresh_team_totals
+from app.models.rounds import UnifiedEvent, EventStatus, EventType, ShortlistedTeam
 from app.models.team_score import TeamScore
 from app.models.evaluation import Evaluation
 from app.models.auth import User
@@ -503,10 +504,10 @@ class CrestoraEventTester:
             print(f"✅ Updated {teams_updated} teams to ACTIVE status")
             
             # 5. Reset rounds to UPCOMING status and clear score-related fields
+            self.database_session.query(ShortlistedTeam).delete()
             rounds_updated = self.database_session.query(UnifiedEvent).update({
                 UnifiedEvent.status: EventStatus.UPCOMING,
                 UnifiedEvent.participated_count: 0,
-                UnifiedEvent.shortlisted_teams: None,
                 UnifiedEvent.is_evaluated: False,
                 UnifiedEvent.is_frozen: False,
                 UnifiedEvent.max_score: None,
@@ -523,6 +524,10 @@ class CrestoraEventTester:
             })
             print(f"✅ Updated {rolling_members_updated} rolling event members")
             
+            # 7. Bulk deletes skip the ORM hooks that keep team totals in sync
+            refresh_team_totals(self.database_session.connection())
+            print("✅ Recalculated team totals")
+            
             # Commit all changes
             self.database_session.commit()
             
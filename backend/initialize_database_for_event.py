@@ -23,6 +23,7 @@ from app.models.evaluation import Evaluation
 from app.models.auth import User
 from app.models.rolling_member import RollingEventMember, RollingMemberStatus
 from app.models.round_weight import RoundWeight
+from app.models.team_totals import refresh_team_totals
 from sqlalchemy.sql import func
 
 def get_db_session():
@@ -102,6 +103,11 @@ def initialize_database_for_event():
         })
         print(f"   ✅ Updated {rolling_members_updated} rolling event members")
         
+        # Bulk deletes skip the ORM hooks that keep team totals in sync
+        session.flush()
+        refresh_team_totals(session.connection())
+        print("   ✅ Recalculated team totals")
+        
         # Commit all changes
         session.commit()
         
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Migration script to replace the department/year ENUM columns of
+rolling_event_results with SMALLINT foreign keys into the departments and
+year_levels lookup tables
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+from app.models.rolling_results import DEPARTMENT_IDS, YEAR_IDS
+
+CREATE_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS departments (
+        id SMALLINT NOT NULL PRIMARY KEY,
+        code VARCHAR(16) NOT NULL UNIQUE,
+        display_name VARCHAR(80) NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS year_levels (
+        id SMALLINT NOT NULL PRIMARY KEY,
+        code VARCHAR(8) NOT NULL UNIQUE,
+        display_name VARCHAR(80) NOT NULL
+    )
+    """,
+]
+
+# (new id column, lookup table, old enum column)
+CONVERTED_COLUMNS = [
+    ("winner_department_id", "departments", "winner_department"),
+    ("winner_year_id", "year_levels", "winner_year"),
+    ("runner_up_department_id", "departments", "runner_up_department"),
+    ("runner_up_year_id", "year_levels", "runner_up_year"),
+]
+
+def add_department_lookup_tables():
+    """Create and seed the lookup tables, then convert the enum columns to ids"""
+    print("🔧 Moving departments and years into lookup tables...")
+
+    try:
+        with engine.connect() as conn:
+            for statement in CREATE_STATEMENTS:
+                conn.execute(text(statement))
+
+            # Enum columns store the member name, which is the lookup code
+            conn.execute(text(
+                "INSERT IGNORE INTO departments (id, code, display_name) VALUES (:id, :code, :display_name)"
+            ), [{"id": i, "code": d.name, "display_name": d.value} for d, i in DEPARTMENT_IDS.items()])
+            conn.execute(text(
+                "INSERT IGNORE INTO year_levels (id, code, display_name) VALUES (:id, :code, :display_name)"
+            ), [{"id": i, "code": y.name, "display_name": y.value} for y, i in YEAR_IDS.items()])
+            print("✅ Created and seeded departments and year_levels")
+
+            # INSERT IGNORE keeps rows that already exist, so make sure they carry the ids the code uses
+            for lookup_table, ids in (("departments", DEPARTMENT_IDS), ("year_levels", YEAR_IDS)):
+                stored = dict(conn.execute(text(f"SELECT code, id FROM {lookup_table}")).fetchall())
+                mismatched = [member.name for member, i in ids.items() if stored.get(member.name) != i]
+                if mismatched:
+                    raise RuntimeError(f"{lookup_table} ids disagree with the code for: {', '.join(mismatched)}")
+
+            for id_column, lookup_table, enum_column in CONVERTED_COLUMNS:
+                try:
+                    conn.execute(text(f"ALTER TABLE rolling_event_results ADD COLUMN {id_column} SMALLINT NULL"))
+                except Exception as e:
+                    if "Duplicate column name" in str(e):
+                        print(f"⚠️  {id_column} already exists, skipping")
+                        continue
+                    raise
+
+                conn.execute(text(f"""
+                    UPDATE rolling_event_results r
+                    JOIN {lookup_table} l ON l.code = r.{enum_column}
+                    SET r.{id_column} = l.id
+                """))
+                conn.execute(text(f"ALTER TABLE rolling_event_results MODIFY {id_column} SMALLINT NOT NULL"))
+                conn.execute(text(
+                    f"ALTER TABLE rolling_event_results ADD FOREIGN KEY ({id_column}) REFERENCES {lookup_table} (id)"
+                ))
+                conn.execute(text(f"ALTER TABLE rolling_event_results DROP COLUMN {enum_column}"))
+                print(f"✅ Converted {enum_column} -> {id_column}")
+
+            conn.commit()
+            print("✅ Department and year lookup tables in place!")
+
+    except Exception as e:
+        print(f"❌ Error converting department/year columns: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_department_lookup_tables()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Migration script to add rounds.criteria_set_at, which tells a round whose
+criteria were never set (NULL) apart from one whose criteria were set to [].
+
+Run it before normalize_round_json_fields.py where possible: while the
+criteria JSON column still exists, rounds that stored an empty list are
+backfilled too. Afterwards only rounds with criteria rows can be recovered.
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+def add_round_criteria_set_at():
+    """Add the column, then mark every round that already has criteria"""
+    print("🔧 Adding criteria_set_at to rounds table...")
+
+    try:
+        with engine.connect() as conn:
+            statement = "ALTER TABLE rounds ADD COLUMN criteria_set_at DATETIME NULL"
+            try:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement}")
+            except Exception as e:
+                if "Duplicate column name" in str(e):
+                    print(f"⚠️  Already applied, skipping: {statement}")
+                else:
+                    raise
+
+            # Rounds whose JSON criteria are set, including an empty list
+            try:
+                result = conn.execute(text(
+                    "UPDATE rounds SET criteria_set_at = COALESCE(updated_at, NOW()) "
+                    "WHERE criteria_set_at IS NULL AND criteria IS NOT NULL"
+                ))
+                print(f"✅ criteria_set_at backfilled from the JSON column for {result.rowcount} rounds")
+            except Exception as e:
+                if "Unknown column" in str(e):
+                    print("⚠️  JSON criteria column already removed, using round_criteria")
+                else:
+                    raise
+
+            try:
+                result = conn.execute(text(
+                    "UPDATE rounds SET criteria_set_at = COALESCE(updated_at, NOW()) "
+                    "WHERE criteria_set_at IS NULL "
+                    "AND id IN (SELECT round_id FROM round_criteria)"
+                ))
+                print(f"✅ criteria_set_at backfilled from criteria rows for {result.rowcount} rounds")
+            except Exception as e:
+                if "doesn't exist" in str(e):
+                    print("⚠️  round_criteria not created yet, skipping")
+                else:
+                    raise
+
+            conn.commit()
+            print("✅ criteria_set_at in place!")
+
+    except Exception as e:
+        print(f"❌ Error adding criteria_set_at: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_round_criteria_set_at()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Migration script to add rounds.max_possible_score (sum of the round's criteria
+max_points, used to normalize evaluations) and backfill it from round_criteria
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+def add_round_max_possible_score():
+    """Add the column, then fill it for every round in one UPDATE (NULL when a round has no criteria)"""
+    print("🔧 Adding max_possible_score to rounds table...")
+
+    try:
+        with engine.connect() as conn:
+            statement = "ALTER TABLE rounds ADD COLUMN max_possible_score DECIMAL(8,2) NULL"
+            try:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement}")
+            except Exception as e:
+                if "Duplicate column name" in str(e):
+                    print(f"⚠️  Already applied, skipping: {statement}")
+                else:
+                    raise
+
+            result = conn.execute(text(
+                "UPDATE rounds SET max_possible_score = ("
+                "SELECT SUM(round_criteria.max_points) FROM round_criteria "
+                "WHERE round_criteria.round_id = rounds.id)"
+            ))
+            conn.commit()
+            print(f"✅ max_possible_score backfilled for {result.rowcount} rounds!")
+
+    except Exception as e:
+        print(f"❌ Error adding max_possible_score: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_round_max_possible_score()
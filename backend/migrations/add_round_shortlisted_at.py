@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Migration script to add rounds.shortlisted_at, which tells a round that was
+never shortlisted (NULL) apart from one whose shortlist kept nobody.
+
+Run it before normalize_round_json_fields.py where possible: while the
+shortlisted_teams JSON column still exists, rounds that stored an empty list
+are backfilled too. Afterwards only rounds with shortlist rows can be recovered.
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+def add_round_shortlisted_at():
+    """Add the column, then mark every round that already has a shortlist"""
+    print("🔧 Adding shortlisted_at to rounds table...")
+
+    try:
+        with engine.connect() as conn:
+            statement = "ALTER TABLE rounds ADD COLUMN shortlisted_at DATETIME NULL"
+            try:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement}")
+            except Exception as e:
+                if "Duplicate column name" in str(e):
+                    print(f"⚠️  Already applied, skipping: {statement}")
+                else:
+                    raise
+
+            # Rounds whose JSON shortlist is set, including an empty one
+            try:
+                result = conn.execute(text(
+                    "UPDATE rounds SET shortlisted_at = COALESCE(updated_at, NOW()) "
+                    "WHERE shortlisted_at IS NULL AND shortlisted_teams IS NOT NULL"
+                ))
+                print(f"✅ shortlisted_at backfilled from the JSON column for {result.rowcount} rounds")
+            except Exception as e:
+                if "Unknown column" in str(e):
+                    print("⚠️  JSON shortlisted_teams column already removed, using round_shortlisted_teams")
+                else:
+                    raise
+
+            try:
+                result = conn.execute(text(
+                    "UPDATE rounds SET shortlisted_at = COALESCE(updated_at, NOW()) "
+                    "WHERE shortlisted_at IS NULL "
+                    "AND id IN (SELECT round_id FROM round_shortlisted_teams)"
+                ))
+                print(f"✅ shortlisted_at backfilled from shortlist rows for {result.rowcount} rounds")
+            except Exception as e:
+                if "doesn't exist" in str(e):
+                    print("⚠️  round_shortlisted_teams not created yet, skipping")
+                else:
+                    raise
+
+            conn.commit()
+            print("✅ shortlisted_at in place!")
+
+    except Exception as e:
+        print(f"❌ Error adding shortlisted_at: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_round_shortlisted_at()
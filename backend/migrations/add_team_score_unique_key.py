@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Migration script to add a unique key on team_scores (round_id, team_id),
+so a team can only ever have one score row per round
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+def add_team_score_unique_key():
+    """Add the (round_id, team_id) unique key to team_scores"""
+    print("🔧 Adding unique key on team_scores (round_id, team_id)...")
+
+    try:
+        with engine.connect() as conn:
+            duplicates = conn.execute(text("""
+                SELECT round_id, team_id, COUNT(*) AS copies
+                FROM team_scores
+                GROUP BY round_id, team_id
+                HAVING COUNT(*) > 1
+            """)).fetchall()
+            if duplicates:
+                print(f"❌ Found {len(duplicates)} duplicated (round_id, team_id) pairs, resolve them first:")
+                for round_id, team_id, copies in duplicates:
+                    print(f"   round {round_id}, team {team_id}: {copies} rows")
+                return
+
+            try:
+                conn.execute(text(
+                    "ALTER TABLE team_scores ADD CONSTRAINT uq_team_scores_round_team UNIQUE (round_id, team_id)"
+                ))
+            except Exception as e:
+                if "Duplicate key name" in str(e):
+                    print("⚠️  Unique key already exists, skipping")
+                    return
+                raise
+
+            conn.commit()
+            print("✅ Unique key added successfully!")
+
+    except Exception as e:
+        print(f"❌ Error adding unique key: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_team_score_unique_key()
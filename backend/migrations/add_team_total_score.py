@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Migration script to add teams.current_total_score (denormalized leaderboard
+weighted score) and backfill it from team_scores and round_weights
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+from app.models.team_totals import refresh_team_totals
+
+def add_team_total_score():
+    """Add the column and its index, then compute every team's total in one UPDATE"""
+    print("🔧 Adding current_total_score to teams table...")
+
+    try:
+        with engine.connect() as conn:
+            for statement in [
+                "ALTER TABLE teams ADD COLUMN current_total_score DECIMAL(7,2) NOT NULL DEFAULT 0",
+                "CREATE INDEX ix_teams_status_total_score ON teams (status, current_total_score)",
+            ]:
+                try:
+                    conn.execute(text(statement))
+                    print(f"✅ Executed: {statement}")
+                except Exception as e:
+                    if "Duplicate column name" in str(e) or "Duplicate key name" in str(e):
+                        print(f"⚠️  Already applied, skipping: {statement}")
+                    else:
+                        raise
+
+            refresh_team_totals(conn)
+            conn.commit()
+            print("✅ current_total_score backfilled successfully!")
+
+    except Exception as e:
+        print(f"❌ Error adding current_total_score: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_team_total_score()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Migration script to make team_members.team_id cascade on delete so deleting a
+team removes its members in the database instead of one DELETE per member
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+def cascade_team_member_deletes():
+    """Recreate the team_members -> teams foreign key with ON DELETE CASCADE"""
+    print("🔧 Adding ON DELETE CASCADE to team_members.team_id...")
+
+    try:
+        with engine.connect() as conn:
+            constraint_names = conn.execute(text("""
+                SELECT CONSTRAINT_NAME FROM information_schema.KEY_COLUMN_USAGE
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME = 'team_members'
+                  AND COLUMN_NAME = 'team_id'
+                  AND REFERENCED_TABLE_NAME = 'teams'
+            """)).scalars().all()
+
+            for name in constraint_names:
+                conn.execute(text(f"ALTER TABLE team_members DROP FOREIGN KEY `{name}`"))
+                print(f"✅ Dropped foreign key {name}")
+
+            conn.execute(text("""
+                ALTER TABLE team_members
+                ADD CONSTRAINT team_members_team_id_fkey
+                FOREIGN KEY (team_id) REFERENCES teams (team_id) ON DELETE CASCADE
+            """))
+            conn.commit()
+            print("✅ team_members.team_id now cascades on delete!")
+
+    except Exception as e:
+        print(f"❌ Error updating team_members foreign key: {e}")
+        raise
+
+if __name__ == "__main__":
+    cascade_team_member_deletes()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Migration script to store scores and weights as fixed-point DECIMAL instead of
+FLOAT and to index team_scores by (round_id, score) for per-round leaderboards
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+ALTER_STATEMENTS = [
+    "ALTER TABLE team_scores MODIFY score DECIMAL(5,2) NOT NULL DEFAULT 0",
+    "ALTER TABLE team_scores MODIFY raw_total_score DECIMAL(7,2) NOT NULL DEFAULT 0",
+    "ALTER TABLE round_weights MODIFY weight_percentage DECIMAL(6,2) NOT NULL DEFAULT 100",
+    "ALTER TABLE rounds MODIFY max_score DECIMAL(5,2) NULL",
+    "ALTER TABLE rounds MODIFY min_score DECIMAL(5,2) NULL",
+    "ALTER TABLE rounds MODIFY avg_score DECIMAL(5,2) NULL",
+    "ALTER TABLE round_criteria MODIFY max_points DECIMAL(6,2) NOT NULL DEFAULT 0",
+    "ALTER TABLE evaluations MODIFY score DECIMAL(5,2) NOT NULL",
+    "ALTER TABLE evaluations MODIFY max_score DECIMAL(5,2) NULL DEFAULT 100",
+    "CREATE INDEX ix_team_scores_round_score ON team_scores (round_id, score)",
+]
+
+# (table, column, largest value the new DECIMAL holds once rounded to 2 places)
+RANGE_CHECKS = [
+    ("team_scores", "score", 999.99),
+    ("team_scores", "raw_total_score", 99999.99),
+    ("round_weights", "weight_percentage", 9999.99),
+    ("rounds", "max_score", 999.99),
+    ("rounds", "min_score", 999.99),
+    ("rounds", "avg_score", 999.99),
+    ("round_criteria", "max_points", 9999.99),
+    ("evaluations", "score", 999.99),
+    ("evaluations", "max_score", 999.99),
+]
+
+def convert_scores_to_decimal():
+    """Convert FLOAT score columns to DECIMAL and add the leaderboard index"""
+    print("🔧 Converting score columns to DECIMAL...")
+
+    try:
+        with engine.connect() as conn:
+            # Refuse to clamp: every stored value must already fit the new definitions
+            out_of_range = False
+            for table, column, limit in RANGE_CHECKS:
+                try:
+                    count = conn.execute(text(
+                        f"SELECT COUNT(*) FROM {table} WHERE ABS({column}) >= {limit} + 0.005"
+                    )).scalar()
+                except Exception as e:
+                    if "doesn't exist" in str(e):
+                        continue
+                    raise
+                if count:
+                    print(f"❌ {count} {table}.{column} values do not fit (largest allowed is {limit})")
+                    out_of_range = True
+            if out_of_range:
+                return
+
+            for statement in ALTER_STATEMENTS:
+                try:
+                    conn.execute(text(statement))
+                    print(f"✅ Executed: {statement}")
+                except Exception as e:
+                    if "doesn't exist" in str(e) or "Duplicate key name" in str(e):
+                        print(f"⚠️  Skipping (already applied or table missing): {statement}")
+                    else:
+                        raise
+
+            conn.commit()
+            print("✅ Score columns converted successfully!")
+
+    except Exception as e:
+        print(f"❌ Error converting score columns: {e}")
+        raise
+
+if __name__ == "__main__":
+    convert_scores_to_decimal()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Migration script to drop the ix_<table>_id indexes that duplicate each table's
+primary key (created by index=True on the id columns)
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+TABLES = [
+    "users",
+    "teams",
+    "team_members",
+    "team_scores",
+    "rounds",
+    "round_weights",
+    "evaluations",
+    "rolling_event_members",
+    "rolling_event_results",
+]
+
+def drop_redundant_id_indexes():
+    """Drop ix_<table>_id on every table that has one"""
+    print("🔧 Dropping indexes that duplicate primary keys...")
+
+    try:
+        with engine.connect() as conn:
+            for table in TABLES:
+                try:
+                    conn.execute(text(f"DROP INDEX ix_{table}_id ON {table}"))
+                    print(f"✅ Dropped ix_{table}_id")
+                except Exception as e:
+                    if "check that" in str(e) and "exists" in str(e) or "doesn't exist" in str(e):
+                        print(f"⚠️  ix_{table}_id not found, skipping")
+                    else:
+                        raise
+
+            conn.commit()
+            print("✅ Redundant indexes dropped successfully!")
+
+    except Exception as e:
+        print(f"❌ Error dropping redundant indexes: {e}")
+        raise
+
+if __name__ == "__main__":
+    drop_redundant_id_indexes()
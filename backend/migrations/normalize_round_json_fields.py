@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Migration script to move rounds.criteria and rounds.shortlisted_teams JSON blobs
+into the round_criteria and round_shortlisted_teams child tables
+"""
+
+import os
+import sys
+import json
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+CREATE_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS round_criteria (
+        round_id INTEGER NOT NULL,
+        ordinal INTEGER NOT NULL,
+        name VARCHAR(100) NOT NULL,
+        max_points FLOAT NOT NULL DEFAULT 0,
+        PRIMARY KEY (round_id, ordinal),
+        FOREIGN KEY (round_id) REFERENCES rounds (id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS round_shortlisted_teams (
+        round_id INTEGER NOT NULL,
+        team_id VARCHAR(20) NOT NULL,
+        PRIMARY KEY (round_id, team_id),
+        FOREIGN KEY (round_id) REFERENCES rounds (id) ON DELETE CASCADE,
+        FOREIGN KEY (team_id) REFERENCES teams (team_id) ON DELETE CASCADE
+    )
+    """,
+]
+
+DROP_STATEMENTS = [
+    "ALTER TABLE rounds DROP COLUMN criteria",
+    "ALTER TABLE rounds DROP COLUMN shortlisted_teams",
+]
+
+def _load_json(value):
+    """Decode a JSON column value (drivers may return str or already-decoded data)"""
+    if value is None:
+        return []
+    if isinstance(value, (bytes, str)):
+        return json.loads(value) or []
+    return value
+
+def normalize_round_json_fields():
+    """Copy each criteria/shortlisted_teams blob into rows, then drop the JSON columns"""
+    print("🔧 Normalizing rounds.criteria and rounds.shortlisted_teams...")
+
+    try:
+        with engine.connect() as conn:
+            for statement in CREATE_STATEMENTS:
+                conn.execute(text(statement))
+            print("✅ Created round_criteria and round_shortlisted_teams tables")
+
+            try:
+                rows = conn.execute(text("SELECT id, criteria, shortlisted_teams FROM rounds")).fetchall()
+            except Exception as e:
+                if "Unknown column" in str(e) or "no such column" in str(e):
+                    print("⚠️  JSON columns already removed, skipping data copy")
+                    conn.commit()
+                    return
+                raise
+
+            criteria_rows = []
+            shortlist_rows = []
+            for round_id, criteria, shortlisted_teams in rows:
+                for ordinal, criterion in enumerate(_load_json(criteria)):
+                    criteria_rows.append({
+                        "round_id": round_id,
+                        "ordinal": ordinal,
+                        "name": criterion.get("name", "Unknown"),
+                        "max_points": criterion.get("max_points", 0)
+                    })
+                for team_id in dict.fromkeys(_load_json(shortlisted_teams)):
+                    shortlist_rows.append({"round_id": round_id, "team_id": team_id})
+
+            if criteria_rows:
+                conn.execute(text(
+                    "INSERT INTO round_criteria (round_id, ordinal, name, max_points) "
+                    "VALUES (:round_id, :ordinal, :name, :max_points)"
+                ), criteria_rows)
+            if shortlist_rows:
+                conn.execute(text(
+                    "INSERT INTO round_shortlisted_teams (round_id, team_id) "
+                    "VALUES (:round_id, :team_id)"
+                ), shortlist_rows)
+            print(f"✅ Copied {len(criteria_rows)} criteria and {len(shortlist_rows)} shortlist entries")
+
+            for statement in DROP_STATEMENTS:
+                conn.execute(text(statement))
+                print(f"✅ Executed: {statement}")
+
+            conn.commit()
+            print("✅ Round JSON fields normalized successfully!")
+
+    except Exception as e:
+        print(f"❌ Error normalizing round JSON fields: {e}")
+        raise
+
+if __name__ == "__main__":
+    normalize_round_json_fields()
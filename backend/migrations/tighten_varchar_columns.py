@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Migration script to shrink overprovisioned VARCHAR columns and store
+IDs/codes/register numbers/phone numbers as ascii instead of utf8mb4
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+ASCII = "CHARACTER SET ascii COLLATE ascii_general_ci"
+
+# Foreign key columns must share charset/collation with the column they reference,
+# so every team_id column is converted in the same run (with FK checks disabled)
+ALTER_STATEMENTS = [
+    "ALTER TABLE users MODIFY hashed_password VARCHAR(100) NOT NULL",
+    f"ALTER TABLE teams MODIFY team_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE teams MODIFY leader_register_number VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE teams MODIFY leader_contact VARCHAR(15) {ASCII} NOT NULL",
+    f"ALTER TABLE team_members MODIFY team_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE team_members MODIFY register_number VARCHAR(20) {ASCII} NOT NULL",
+    "ALTER TABLE team_members MODIFY member_position VARCHAR(8) NOT NULL",
+    f"ALTER TABLE team_scores MODIFY team_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE team_scores MODIFY event_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rounds MODIFY event_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rounds MODIFY event_code VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rounds MODIFY round_code VARCHAR(50) {ASCII} NULL",
+    f"ALTER TABLE round_shortlisted_teams MODIFY team_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE evaluations MODIFY team_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE evaluations MODIFY event_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_members MODIFY register_number VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_members MODIFY contact VARCHAR(15) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_members MODIFY event_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_results MODIFY event_id VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_results MODIFY winner_register_number VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_results MODIFY winner_phone VARCHAR(15) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_results MODIFY runner_up_register_number VARCHAR(20) {ASCII} NOT NULL",
+    f"ALTER TABLE rolling_event_results MODIFY runner_up_phone VARCHAR(15) {ASCII} NOT NULL",
+]
+
+def tighten_varchar_columns():
+    """Apply the tighter column definitions"""
+    print("🔧 Tightening VARCHAR columns...")
+
+    try:
+        with engine.connect() as conn:
+            # Refuse to truncate: every value must already fit the new definitions
+            too_long = conn.execute(text(
+                "SELECT COUNT(*) FROM team_members WHERE CHAR_LENGTH(member_position) > 8"
+            )).scalar()
+            if too_long:
+                print(f"❌ {too_long} team_members.member_position values are longer than 8 characters")
+                return
+
+            conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+            try:
+                for statement in ALTER_STATEMENTS:
+                    try:
+                        conn.execute(text(statement))
+                        print(f"✅ Executed: {statement}")
+                    except Exception as e:
+                        if "doesn't exist" in str(e):
+                            print(f"⚠️  Table missing, skipping: {statement}")
+                        else:
+                            raise
+            finally:
+                conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+
+            conn.commit()
+            print("✅ VARCHAR columns tightened successfully!")
+
+    except Exception as e:
+        print(f"❌ Error tightening VARCHAR columns: {e}")
+        raise
+
+if __name__ == "__main__":
+    tighten_varchar_columns()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Migration script to widen team_scores.id and evaluations.id to BIGINT
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+load_dotenv()
+
+from sqlalchemy import text
+from app.database import engine
+
+ALTER_STATEMENTS = [
+    "ALTER TABLE team_scores MODIFY id BIGINT NOT NULL AUTO_INCREMENT",
+    "ALTER TABLE evaluations MODIFY id BIGINT NOT NULL AUTO_INCREMENT",
+]
+
+def widen_score_ids():
+    """Switch the high-volume tables to 64-bit auto-increment keys"""
+    print("🔧 Widening team_scores.id and evaluations.id to BIGINT...")
+
+    try:
+        with engine.connect() as conn:
+            for statement in ALTER_STATEMENTS:
+                try:
+                    conn.execute(text(statement))
+                    print(f"✅ Executed: {statement}")
+                except Exception as e:
+                    if "doesn't exist" in str(e):
+                        print(f"⚠️  Table missing, skipping: {statement}")
+                    else:
+                        raise
+
+            conn.commit()
+            print("✅ Primary keys widened successfully!")
+            print("ℹ️  For concurrent bulk inserts also set innodb_autoinc_lock_mode=2 in the MySQL server config")
+
+    except Exception as e:
+        print(f"❌ Error widening primary keys: {e}")
+        raise
+
+if __name__ == "__main__":
+    widen_score_ids()
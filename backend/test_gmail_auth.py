@@ -22,7 +22,8 @@ def test_gmail_auth():
     
     # Test Gmail service initialization
     try:
-        is_authenticated = gmail_service.is_authenticated()
+        # Opens the browser consent flow when there is no usable token.json yet
+        is_authenticated = gmail_service.authenticate_interactive()
         if is_authenticated:
             print("✅ Gmail service authenticated successfully!")
             print("🎉 Ready to send emails!")
@@ -4,6 +4,7 @@ Test script for PDF generation
 Run this to verify PDF export is working correctly
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -68,11 +69,11 @@ def test_official_pdf():
     ]
     
     try:
-        pdf_bytes = pdf_service.generate_official_leaderboard_pdf(
+        pdf_bytes = asyncio.run(pdf_service.generate_official_leaderboard_pdf(
             teams=teams,
             event_name="CRESTORA'25",
             round_number=3
-        )
+        ))
         
         # Save to file
         output_file = Path(__file__).parent / "test_official_leaderboard.pdf"
@@ -145,11 +146,11 @@ def test_detailed_pdf():
     ]
     
     try:
-        pdf_bytes = pdf_service.generate_detailed_leaderboard_pdf(
+        pdf_bytes = asyncio.run(pdf_service.generate_detailed_leaderboard_pdf(
             teams=teams,
             event_name="CRESTORA'25",
             include_scores=True
-        )
+        ))
         
         # Save to file
         output_file = Path(__file__).parent / "test_detailed_leaderboard.pdf"